@@ -8,10 +8,13 @@ import os
 import sys
 from typing import Optional
 
-def get_langfuse_client():
+def get_langfuse_client(httpx_client=None):
     """
     Initialize and return a Langfuse client using environment variables.
 
+    Args:
+        httpx_client: Optional pre-configured httpx.Client to use as the SDK transport
+
     Returns:
         Langfuse client instance
 
@@ -39,12 +42,16 @@ def get_langfuse_client():
         print("ERROR: LANGFUSE_SECRET_KEY environment variable not set", file=sys.stderr)
         sys.exit(1)
 
+    client_kwargs = {
+        "public_key": public_key,
+        "secret_key": secret_key,
+        "host": host
+    }
+    if httpx_client is not None:
+        client_kwargs["httpx_client"] = httpx_client
+
     try:
-        client = Langfuse(
-            public_key=public_key,
-            secret_key=secret_key,
-            host=host
-        )
+        client = Langfuse(**client_kwargs)
         return client
     except Exception as e:
         print(f"ERROR: Failed to initialize Langfuse client: {e}", file=sys.stderr)
@@ -18,9 +18,28 @@ import os
 import sys
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 DEFAULT_API_URL = os.getenv("PROD_API_URL", "https://webresearchagent.replit.app")
 
+# Retry only failures where the batch cannot have started: connection errors
+# before the request is sent, and 429/503 rejections (honouring Retry-After).
+# Read timeouts and 502/504 are not retried, since the server may already be
+# running the batch and a second POST would send duplicate emails.
+RETRY = Retry(
+    total=5,
+    read=0,
+    backoff_factor=1.5,
+    status_forcelist=[429, 503],
+    allowed_methods=["POST"],
+    respect_retry_after_header=True
+)
+
+session = requests.Session()
+session.mount("https://", HTTPAdapter(max_retries=RETRY))
+session.mount("http://", HTTPAdapter(max_retries=RETRY))
+
 
 def execute_batch(
     api_key: str,
@@ -46,7 +65,7 @@ def execute_batch(
     print(f"  Callback: {callback_url}")
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = session.post(url, headers=headers, json=payload, timeout=30)
         response.raise_for_status()
 
         result = response.json()
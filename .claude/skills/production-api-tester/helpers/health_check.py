@@ -9,6 +9,7 @@ USAGE:
 python3 health_check.py
 python3 health_check.py --api-url "http://localhost:8000"
 python3 health_check.py --continuous --interval 60
+python3 health_check.py --probe /health,/api/strategies --api-key "$PROD_API_KEY"
 """
 
 import argparse
@@ -17,55 +18,100 @@ import os
 import sys
 import time
 import requests
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 DEFAULT_API_URL = os.getenv("PROD_API_URL", "https://webresearchagent.replit.app")
 
+# Flush buffered log lines once either threshold is reached
+LOG_BUFFER_LINES = 64
+LOG_BUFFER_SECONDS = 10
 
-def check_health(api_url: str) -> dict:
-    """Check API health."""
+# Judged by its reported status; other probes are healthy on any 2xx
+HEALTH_PATH = "/health"
 
-    url = f"{api_url}/health"
+
+def _iso_now(ns=time.time_ns) -> str:
+    """Return the current UTC time as an ISO 8601 string with microseconds."""
+    seconds, remainder = divmod(ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{remainder // 1000:06d}Z"
+
+
+def check_health(api_url: str, path: str = HEALTH_PATH, api_key: str = None) -> dict:
+    """Check API health.
+
+    The /health probe is judged by the status it reports; any other
+    endpoint is healthy when it answers with a 2xx. api_key is sent as
+    X-API-Key for authenticated endpoints such as /api/strategies.
+    """
+
+    url = f"{api_url}{path}"
+    headers = {"X-API-Key": api_key} if api_key else None
 
     try:
-        start_time = time.time()
-        response = requests.get(url, timeout=10)
-        response_time = (time.time() - start_time) * 1000  # Convert to ms
+        start_time = time.monotonic()
+        response = requests.get(url, headers=headers, timeout=10)
+        response_time = (time.monotonic() - start_time) * 1000  # Convert to ms
 
         response.raise_for_status()
-        health = response.json()
 
-        health['response_time_ms'] = round(response_time, 2)
-        health['healthy'] = health.get('status') == 'online'
+        if path != HEALTH_PATH:
+            return {
+                'status': response.status_code,
+                'response_time_ms': round(response_time, 2),
+                'healthy': True
+            }
 
-        return health
+        health = response.json()
+        if not isinstance(health, dict):
+            health = {}
 
-    except requests.exceptions.ConnectionError:
         return {
-            'healthy': False,
-            'status': 'offline',
-            'error': 'Connection failed - API not reachable'
-        }
-    except requests.exceptions.Timeout:
-        return {
-            'healthy': False,
-            'status': 'timeout',
-            'error': 'Request timed out after 10s'
+            **health,
+            'response_time_ms': round(response_time, 2),
+            'healthy': health.get('status') == 'online'
         }
+
     except Exception as e:
+        if isinstance(e, requests.exceptions.ConnectionError):
+            status, error = 'offline', 'Connection failed - API not reachable'
+        elif isinstance(e, requests.exceptions.Timeout):
+            status, error = 'timeout', 'Request timed out after 10s'
+        else:
+            status, error = 'error', str(e)
+
         return {
             'healthy': False,
-            'status': 'error',
-            'error': str(e)
+            'status': status,
+            'error': error
         }
 
 
+def check_endpoints(api_url: str, paths: list, api_key: str = None) -> list:
+    """Check several endpoints concurrently.
+
+    Total check time is the slowest probe rather than the sum of all probes.
+    """
+    if len(paths) == 1:
+        results = [check_health(api_url, paths[0], api_key)]
+    else:
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            results = list(executor.map(lambda path: check_health(api_url, path, api_key), paths))
+
+    for path, health in zip(paths, results):
+        health['endpoint'] = path
+
+    return results
+
+
 def print_health_status(health: dict, timestamp: str = None):
     """Print health status in readable format."""
 
     if timestamp:
         print(f"[{timestamp}]", end=" ")
 
+    if health.get('endpoint'):
+        print(f"{health['endpoint']}:", end=" ")
+
     if health.get('healthy'):
         print("✓ API is healthy")
         print(f"  Status: {health.get('status', 'unknown')}")
@@ -96,11 +142,18 @@ Examples:
 
   # Continuous monitoring (check every 60s for 1 hour)
   %(prog)s --continuous --interval 60 --duration 3600
+
+  # Probe several endpoints concurrently (/api/* routes need an API key)
+  %(prog)s --probe /health,/api/strategies --api-key "$PROD_API_KEY"
         """
     )
 
     parser.add_argument('--api-url', default=DEFAULT_API_URL,
                        help=f'API base URL (default: {DEFAULT_API_URL})')
+    parser.add_argument('--probe', default='/health',
+                       help='Comma-separated endpoint paths to check concurrently (default: /health)')
+    parser.add_argument('--api-key', default=os.getenv("PROD_API_KEY"),
+                       help='API key sent as X-API-Key to authenticated probes (default: $PROD_API_KEY)')
     parser.add_argument('--continuous', action='store_true',
                        help='Continuously monitor health')
     parser.add_argument('--interval', type=int, default=60,
@@ -110,11 +163,15 @@ Examples:
     parser.add_argument('--output', help='Output file for health logs (JSON lines)')
 
     args = parser.parse_args()
+    probes = [path.strip() for path in args.probe.split(',') if path.strip()]
 
     output_file = None
     if args.output:
         output_file = open(args.output, 'a')
 
+    log_buffer = []
+    last_flush = time.monotonic()
+
     try:
         if args.continuous:
             print(f"Monitoring API health: {args.api_url}")
@@ -125,28 +182,37 @@ Examples:
                 print(f"Duration: Infinite (Ctrl+C to stop)")
             print("="*60)
 
-            start_time = time.time()
+            start_time = time.monotonic()
             iteration = 0
 
             while True:
                 iteration += 1
-                timestamp = datetime.now().isoformat()
+                timestamp = _iso_now()
 
-                health = check_health(args.api_url)
-                print_health_status(health, timestamp)
+                results = check_endpoints(args.api_url, probes, args.api_key)
+                for health in results:
+                    print_health_status(health, timestamp)
 
                 if output_file:
-                    log_entry = {
-                        'timestamp': timestamp,
-                        'iteration': iteration,
-                        **health
-                    }
-                    output_file.write(json.dumps(log_entry) + '\n')
-                    output_file.flush()
+                    for health in results:
+                        log_entry = {
+                            'timestamp': timestamp,
+                            'iteration': iteration,
+                            **health
+                        }
+                        log_buffer.append(json.dumps(log_entry) + '\n')
+
+                    now = time.monotonic()
+                    if (len(log_buffer) >= LOG_BUFFER_LINES
+                            or now - last_flush >= LOG_BUFFER_SECONDS):
+                        output_file.writelines(log_buffer)
+                        output_file.flush()
+                        log_buffer.clear()
+                        last_flush = now
 
                 # Check duration
                 if args.duration > 0:
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     if elapsed >= args.duration:
                         print(f"\nMonitoring complete ({args.duration}s elapsed)")
                         break
@@ -157,23 +223,27 @@ Examples:
 
         else:
             # Single check
-            health = check_health(args.api_url)
-            print_health_status(health)
+            results = check_endpoints(args.api_url, probes, args.api_key)
+            for health in results:
+                print_health_status(health)
 
             if args.output:
-                log_entry = {
-                    'timestamp': datetime.now().isoformat(),
-                    **health
-                }
-                output_file.write(json.dumps(log_entry) + '\n')
+                timestamp = _iso_now()
+                for health in results:
+                    log_entry = {
+                        'timestamp': timestamp,
+                        **health
+                    }
+                    output_file.write(json.dumps(log_entry) + '\n')
 
             # Exit code based on health
-            sys.exit(0 if health.get('healthy') else 1)
+            sys.exit(0 if all(health.get('healthy') for health in results) else 1)
 
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped by user")
     finally:
         if output_file:
+            output_file.writelines(log_buffer)
             output_file.close()
             print(f"\nHealth logs saved to: {args.output}")
 
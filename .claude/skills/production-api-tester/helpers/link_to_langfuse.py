@@ -10,9 +10,16 @@ python3 link_to_langfuse.py \
   --task-id "abc123" \
   --email "test@example.com" \
   --output /tmp/langfuse_link.json
+
+python3 link_to_langfuse.py \
+  --task-id-file /tmp/task_ids.txt \
+  --email "test@example.com" \
+  --output /tmp/langfuse_links.json
 """
 
 import argparse
+import asyncio
+import functools
 import json
 import os
 import sys
@@ -20,38 +27,90 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
-# Add langfuse helpers to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
+# Langfuse helpers are imported lazily so --help does not pay the SDK import cost
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
 LANGFUSE_HELPERS = PROJECT_ROOT / ".claude/skills/langfuse-optimization/helpers"
-sys.path.insert(0, str(LANGFUSE_HELPERS))
 
-try:
-    from langfuse_client import get_langfuse_client
-except ImportError:
-    print(f"Error: Could not import langfuse helpers", file=sys.stderr)
-    print(f"Expected path: {LANGFUSE_HELPERS}", file=sys.stderr)
-    sys.exit(1)
+# Supported --time-range windows
+TIME_RANGES = {
+    "last_15_min": timedelta(minutes=15),
+    "last_30_min": timedelta(minutes=30),
+    "last_1_hour": timedelta(hours=1),
+    "last_6_hours": timedelta(hours=6),
+    "last_1_day": timedelta(days=1)
+}
+
+# Stop paginating once this many matching traces are found
+MAX_TRACES = 10
+
+# Upper bound on trace.list pages scanned per lookup
+MAX_PAGES = 20
+
+# Maximum concurrent trace lookups in --task-id-file mode
+MAX_CONCURRENCY = 8
+
+
+def _import_client_factory():
+    """Import get_langfuse_client from the langfuse-optimization helpers."""
+    if str(LANGFUSE_HELPERS) not in sys.path:
+        sys.path.insert(0, str(LANGFUSE_HELPERS))
+
+    try:
+        from langfuse_client import get_langfuse_client
+    except ImportError:
+        print(f"Error: Could not import langfuse helpers", file=sys.stderr)
+        print(f"Expected path: {LANGFUSE_HELPERS}", file=sys.stderr)
+        sys.exit(1)
+
+    return get_langfuse_client
+
+
+def build_http_client():
+    """Build a pooled keep-alive httpx client for the Langfuse SDK transport.
+
+    HTTP/2 is enabled when the optional ``h2`` package is installed so that
+    paginated trace.list calls share one TCP+TLS connection.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    """Return the process-wide Langfuse client, created on first use."""
+    get_langfuse_client = _import_client_factory()
+    return get_langfuse_client(httpx_client=build_http_client())
 
 
 def find_trace(
     task_id: str,
     email: str,
     time_range: str = "last_1_hour",
-    topic: str = None
+    topic: str = None,
+    client=None
 ) -> dict:
-    """Find Langfuse trace for task execution."""
+    """Find Langfuse trace for task execution.
+
+    Pass ``client`` to use a caller-managed Langfuse client instead of the
+    cached process-wide one.
+    """
 
-    client = get_langfuse_client()
+    if client is None:
+        client = _client()
 
     # Calculate time range
-    time_ranges = {
-        "last_15_min": timedelta(minutes=15),
-        "last_30_min": timedelta(minutes=30),
-        "last_1_hour": timedelta(hours=1),
-        "last_6_hours": timedelta(hours=6),
-        "last_1_day": timedelta(days=1)
-    }
-    delta = time_ranges.get(time_range, timedelta(hours=1))
+    delta = TIME_RANGES.get(time_range, TIME_RANGES["last_1_hour"])
     end_time = datetime.now()
     start_time = end_time - delta
 
@@ -72,7 +131,7 @@ def find_trace(
         all_traces = []
         page = 1
 
-        while len(all_traces) < 10:  # Limit to 10 traces
+        while len(all_traces) < MAX_TRACES and page <= MAX_PAGES:
             params = {
                 'limit': 10,
                 'page': page,
@@ -84,16 +143,20 @@ def find_trace(
             if not hasattr(traces_response, 'data') or not traces_response.data:
                 break
 
-            # Filter by metadata
+            # Filter by metadata; only matching traces are serialized to dicts
             for trace in traces_response.data:
-                trace_dict = trace.dict() if hasattr(trace, 'dict') else trace
-                meta = trace_dict.get('metadata', {})
+                if isinstance(trace, dict):
+                    meta = trace.get('metadata')
+                else:
+                    meta = getattr(trace, 'metadata', None)
 
                 # Check if metadata matches
-                if meta.get('user_email') == email:
-                    all_traces.append(trace_dict)
+                if isinstance(meta, dict) and meta.get('user_email') == email:
+                    all_traces.append(trace.dict() if hasattr(trace, 'dict') else trace)
+                    if len(all_traces) >= MAX_TRACES:
+                        break
 
-            if len(traces_response.data) < 10:
+            if len(all_traces) >= MAX_TRACES or len(traces_response.data) < 10:
                 break
 
             page += 1
@@ -156,6 +219,59 @@ def find_trace(
         raise
 
 
+async def find_trace_async(
+    client,
+    task_id: str,
+    email: str,
+    time_range: str = "last_1_hour",
+    topic: str = None
+) -> dict:
+    """Run find_trace in a worker thread so lookups can overlap."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(find_trace, task_id, email, time_range, topic, client=client)
+    )
+
+
+async def find_traces(
+    task_ids: list,
+    email: str,
+    time_range: str = "last_1_hour",
+    topic: str = None,
+    max_concurrency: int = MAX_CONCURRENCY
+) -> list:
+    """Find Langfuse traces for many tasks concurrently with one shared client.
+
+    A failed lookup does not abort the batch; its task gets an entry with
+    trace_count 0 and the error message instead.
+    """
+    client = _client()
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def bound(task_id):
+        async with sem:
+            return await find_trace_async(client, task_id, email, time_range, topic)
+
+    lookups = await asyncio.gather(
+        *(bound(task_id) for task_id in task_ids), return_exceptions=True
+    )
+
+    results = []
+    for task_id, result in zip(task_ids, lookups):
+        if isinstance(result, BaseException):
+            print(f"Error finding trace for task {task_id}: {result}", file=sys.stderr)
+            result = {
+                "task_id": task_id,
+                "trace_count": 0,
+                "traces": [],
+                "error": str(result)
+            }
+        results.append(result)
+
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Find Langfuse trace for task execution',
@@ -170,16 +286,22 @@ Examples:
 
   # With topic filter
   %(prog)s --task-id "abc123" --email "test@example.com" --topic "AI news"
+
+  # Many tasks at once (one task ID per line)
+  %(prog)s --task-id-file /tmp/task_ids.txt --email "test@example.com"
         """
     )
 
     # Required
-    parser.add_argument('--task-id', required=True, help='Task ID from create_test_task.py')
+    task_group = parser.add_mutually_exclusive_group(required=True)
+    task_group.add_argument('--task-id', help='Task ID from create_test_task.py')
+    task_group.add_argument('--task-id-file',
+                           help='File with newline-delimited task IDs to look up concurrently')
     parser.add_argument('--email', required=True, help='Email used for task')
 
     # Optional
     parser.add_argument('--time-range', default='last_1_hour',
-                       choices=['last_15_min', 'last_30_min', 'last_1_hour', 'last_6_hours', 'last_1_day'],
+                       choices=list(TIME_RANGES),
                        help='Time range to search (default: last_1_hour)')
     parser.add_argument('--topic', help='Research topic (for additional filtering)')
     parser.add_argument('--output', default='/tmp/api_test/langfuse_link.json',
@@ -187,6 +309,10 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.task_id_file:
+        run_batch(args)
+        return
+
     try:
         result = find_trace(
             task_id=args.task_id,
@@ -218,5 +344,38 @@ Examples:
         sys.exit(1)
 
 
+def run_batch(args):
+    """Look up traces for every task ID in args.task_id_file."""
+    try:
+        with open(args.task_id_file) as f:
+            task_ids = [line.strip() for line in f if line.strip()]
+
+        results = asyncio.run(find_traces(
+            task_ids,
+            email=args.email,
+            time_range=args.time_range,
+            topic=args.topic
+        ))
+
+        # Save output
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+
+        found = sum(1 for r in results if r['trace_count'] > 0)
+        failed = sum(1 for r in results if 'error' in r)
+        print(f"\n✓ Found traces for {found}/{len(results)} tasks")
+        if failed:
+            print(f"⚠️  {failed} lookups failed (see 'error' in output)")
+        print(f"✓ Trace links saved to: {output_path}")
+
+    except Exception as e:
+        print(f"\n✗ Failed to find traces: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,156 @@
+# Generated by validate_strategy.py --compile-schema from strategies/schema.json.
+# Do not edit; regenerate after changing the schema.
+SCHEMA_SHA256 = "28b03c719606a184115106f8f21d58ec1ca437cd65bdf52b0cfae188e75e3b57"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['meta', 'tool_chain'], 'properties': {'meta': {'type': 'object', 'required': ['slug', 'version', 'category', 'time_window', 'depth'], 'properties': {'slug': {'type': 'string'}, 'version': {'type': 'integer'}, 'category': {'type': 'string'}, 'time_window': {'type': 'string'}, 'depth': {'type': 'string'}}}, 'tool_chain': {'type': 'array', 'items': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'params': {'type': 'object'}, 'loop': {'type': 'integer'}, 'use': {'type': 'string'}, 'description': {'type': 'string'}, 'inputs': {'type': 'object'}, 'llm_fill': {'type': 'array', 'items': {'type': 'string'}}, 'save_as': {'type': 'string'}, 'foreach': {'type': 'string'}, 'when': {'type': 'string'}, 'phase': {'type': 'string'}}, 'additionalProperties': True}}, 'queries': {'type': 'object'}, 'filters': {'type': 'object'}, 'quorum': {'type': 'object'}, 'render': {'type': 'object'}, 'limits': {'type': 'object'}}, 'additionalProperties': True}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['meta', 'tool_chain']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['meta', 'tool_chain'], 'properties': {'meta': {'type': 'object', 'required': ['slug', 'version', 'category', 'time_window', 'depth'], 'properties': {'slug': {'type': 'string'}, 'version': {'type': 'integer'}, 'category': {'type': 'string'}, 'time_window': {'type': 'string'}, 'depth': {'type': 'string'}}}, 'tool_chain': {'type': 'array', 'items': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'params': {'type': 'object'}, 'loop': {'type': 'integer'}, 'use': {'type': 'string'}, 'description': {'type': 'string'}, 'inputs': {'type': 'object'}, 'llm_fill': {'type': 'array', 'items': {'type': 'string'}}, 'save_as': {'type': 'string'}, 'foreach': {'type': 'string'}, 'when': {'type': 'string'}, 'phase': {'type': 'string'}}, 'additionalProperties': True}}, 'queries': {'type': 'object'}, 'filters': {'type': 'object'}, 'quorum': {'type': 'object'}, 'render': {'type': 'object'}, 'limits': {'type': 'object'}}, 'additionalProperties': True}, rule='required')
+        data_keys = set(data.keys())
+        if "meta" in data_keys:
+            data_keys.remove("meta")
+            data__meta = data["meta"]
+            if not isinstance(data__meta, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta must be object", value=data__meta, name="" + (name_prefix or "data") + ".meta", definition={'type': 'object', 'required': ['slug', 'version', 'category', 'time_window', 'depth'], 'properties': {'slug': {'type': 'string'}, 'version': {'type': 'integer'}, 'category': {'type': 'string'}, 'time_window': {'type': 'string'}, 'depth': {'type': 'string'}}}, rule='type')
+            data__meta_is_dict = isinstance(data__meta, dict)
+            if data__meta_is_dict:
+                data__meta__missing_keys = set(['slug', 'version', 'category', 'time_window', 'depth']) - data__meta.keys()
+                if data__meta__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta must contain " + (str(sorted(data__meta__missing_keys)) + " properties"), value=data__meta, name="" + (name_prefix or "data") + ".meta", definition={'type': 'object', 'required': ['slug', 'version', 'category', 'time_window', 'depth'], 'properties': {'slug': {'type': 'string'}, 'version': {'type': 'integer'}, 'category': {'type': 'string'}, 'time_window': {'type': 'string'}, 'depth': {'type': 'string'}}}, rule='required')
+                data__meta_keys = set(data__meta.keys())
+                if "slug" in data__meta_keys:
+                    data__meta_keys.remove("slug")
+                    data__meta__slug = data__meta["slug"]
+                    if not isinstance(data__meta__slug, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.slug must be string", value=data__meta__slug, name="" + (name_prefix or "data") + ".meta.slug", definition={'type': 'string'}, rule='type')
+                if "version" in data__meta_keys:
+                    data__meta_keys.remove("version")
+                    data__meta__version = data__meta["version"]
+                    if not isinstance(data__meta__version, (int)) and not (isinstance(data__meta__version, float) and data__meta__version.is_integer()) or isinstance(data__meta__version, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.version must be integer", value=data__meta__version, name="" + (name_prefix or "data") + ".meta.version", definition={'type': 'integer'}, rule='type')
+                if "category" in data__meta_keys:
+                    data__meta_keys.remove("category")
+                    data__meta__category = data__meta["category"]
+                    if not isinstance(data__meta__category, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.category must be string", value=data__meta__category, name="" + (name_prefix or "data") + ".meta.category", definition={'type': 'string'}, rule='type')
+                if "time_window" in data__meta_keys:
+                    data__meta_keys.remove("time_window")
+                    data__meta__timewindow = data__meta["time_window"]
+                    if not isinstance(data__meta__timewindow, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.time_window must be string", value=data__meta__timewindow, name="" + (name_prefix or "data") + ".meta.time_window", definition={'type': 'string'}, rule='type')
+                if "depth" in data__meta_keys:
+                    data__meta_keys.remove("depth")
+                    data__meta__depth = data__meta["depth"]
+                    if not isinstance(data__meta__depth, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".meta.depth must be string", value=data__meta__depth, name="" + (name_prefix or "data") + ".meta.depth", definition={'type': 'string'}, rule='type')
+        if "tool_chain" in data_keys:
+            data_keys.remove("tool_chain")
+            data__toolchain = data["tool_chain"]
+            if not isinstance(data__toolchain, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain must be array", value=data__toolchain, name="" + (name_prefix or "data") + ".tool_chain", definition={'type': 'array', 'items': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'params': {'type': 'object'}, 'loop': {'type': 'integer'}, 'use': {'type': 'string'}, 'description': {'type': 'string'}, 'inputs': {'type': 'object'}, 'llm_fill': {'type': 'array', 'items': {'type': 'string'}}, 'save_as': {'type': 'string'}, 'foreach': {'type': 'string'}, 'when': {'type': 'string'}, 'phase': {'type': 'string'}}, 'additionalProperties': True}}, rule='type')
+            data__toolchain_is_list = isinstance(data__toolchain, (list, tuple))
+            if data__toolchain_is_list:
+                data__toolchain_len = len(data__toolchain)
+                for data__toolchain_x, data__toolchain_item in enumerate(data__toolchain):
+                    if not isinstance(data__toolchain_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}]".format(**locals()) + " must be object", value=data__toolchain_item, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}]".format(**locals()) + "", definition={'type': 'object', 'properties': {'name': {'type': 'string'}, 'params': {'type': 'object'}, 'loop': {'type': 'integer'}, 'use': {'type': 'string'}, 'description': {'type': 'string'}, 'inputs': {'type': 'object'}, 'llm_fill': {'type': 'array', 'items': {'type': 'string'}}, 'save_as': {'type': 'string'}, 'foreach': {'type': 'string'}, 'when': {'type': 'string'}, 'phase': {'type': 'string'}}, 'additionalProperties': True}, rule='type')
+                    data__toolchain_item_is_dict = isinstance(data__toolchain_item, dict)
+                    if data__toolchain_item_is_dict:
+                        data__toolchain_item_keys = set(data__toolchain_item.keys())
+                        if "name" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("name")
+                            data__toolchain_item__name = data__toolchain_item["name"]
+                            if not isinstance(data__toolchain_item__name, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].name".format(**locals()) + " must be string", value=data__toolchain_item__name, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].name".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "params" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("params")
+                            data__toolchain_item__params = data__toolchain_item["params"]
+                            if not isinstance(data__toolchain_item__params, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].params".format(**locals()) + " must be object", value=data__toolchain_item__params, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].params".format(**locals()) + "", definition={'type': 'object'}, rule='type')
+                        if "loop" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("loop")
+                            data__toolchain_item__loop = data__toolchain_item["loop"]
+                            if not isinstance(data__toolchain_item__loop, (int)) and not (isinstance(data__toolchain_item__loop, float) and data__toolchain_item__loop.is_integer()) or isinstance(data__toolchain_item__loop, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].loop".format(**locals()) + " must be integer", value=data__toolchain_item__loop, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].loop".format(**locals()) + "", definition={'type': 'integer'}, rule='type')
+                        if "use" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("use")
+                            data__toolchain_item__use = data__toolchain_item["use"]
+                            if not isinstance(data__toolchain_item__use, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].use".format(**locals()) + " must be string", value=data__toolchain_item__use, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].use".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "description" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("description")
+                            data__toolchain_item__description = data__toolchain_item["description"]
+                            if not isinstance(data__toolchain_item__description, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].description".format(**locals()) + " must be string", value=data__toolchain_item__description, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].description".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "inputs" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("inputs")
+                            data__toolchain_item__inputs = data__toolchain_item["inputs"]
+                            if not isinstance(data__toolchain_item__inputs, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].inputs".format(**locals()) + " must be object", value=data__toolchain_item__inputs, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].inputs".format(**locals()) + "", definition={'type': 'object'}, rule='type')
+                        if "llm_fill" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("llm_fill")
+                            data__toolchain_item__llmfill = data__toolchain_item["llm_fill"]
+                            if not isinstance(data__toolchain_item__llmfill, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].llm_fill".format(**locals()) + " must be array", value=data__toolchain_item__llmfill, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].llm_fill".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                            data__toolchain_item__llmfill_is_list = isinstance(data__toolchain_item__llmfill, (list, tuple))
+                            if data__toolchain_item__llmfill_is_list:
+                                data__toolchain_item__llmfill_len = len(data__toolchain_item__llmfill)
+                                for data__toolchain_item__llmfill_x, data__toolchain_item__llmfill_item in enumerate(data__toolchain_item__llmfill):
+                                    if not isinstance(data__toolchain_item__llmfill_item, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].llm_fill[{data__toolchain_item__llmfill_x}]".format(**locals()) + " must be string", value=data__toolchain_item__llmfill_item, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].llm_fill[{data__toolchain_item__llmfill_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "save_as" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("save_as")
+                            data__toolchain_item__saveas = data__toolchain_item["save_as"]
+                            if not isinstance(data__toolchain_item__saveas, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].save_as".format(**locals()) + " must be string", value=data__toolchain_item__saveas, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].save_as".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "foreach" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("foreach")
+                            data__toolchain_item__foreach = data__toolchain_item["foreach"]
+                            if not isinstance(data__toolchain_item__foreach, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].foreach".format(**locals()) + " must be string", value=data__toolchain_item__foreach, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].foreach".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "when" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("when")
+                            data__toolchain_item__when = data__toolchain_item["when"]
+                            if not isinstance(data__toolchain_item__when, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].when".format(**locals()) + " must be string", value=data__toolchain_item__when, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].when".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "phase" in data__toolchain_item_keys:
+                            data__toolchain_item_keys.remove("phase")
+                            data__toolchain_item__phase = data__toolchain_item["phase"]
+                            if not isinstance(data__toolchain_item__phase, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].phase".format(**locals()) + " must be string", value=data__toolchain_item__phase, name="" + (name_prefix or "data") + ".tool_chain[{data__toolchain_x}].phase".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "queries" in data_keys:
+            data_keys.remove("queries")
+            data__queries = data["queries"]
+            if not isinstance(data__queries, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".queries must be object", value=data__queries, name="" + (name_prefix or "data") + ".queries", definition={'type': 'object'}, rule='type')
+        if "filters" in data_keys:
+            data_keys.remove("filters")
+            data__filters = data["filters"]
+            if not isinstance(data__filters, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".filters must be object", value=data__filters, name="" + (name_prefix or "data") + ".filters", definition={'type': 'object'}, rule='type')
+        if "quorum" in data_keys:
+            data_keys.remove("quorum")
+            data__quorum = data["quorum"]
+            if not isinstance(data__quorum, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".quorum must be object", value=data__quorum, name="" + (name_prefix or "data") + ".quorum", definition={'type': 'object'}, rule='type')
+        if "render" in data_keys:
+            data_keys.remove("render")
+            data__render = data["render"]
+            if not isinstance(data__render, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".render must be object", value=data__render, name="" + (name_prefix or "data") + ".render", definition={'type': 'object'}, rule='type')
+        if "limits" in data_keys:
+            data_keys.remove("limits")
+            data__limits = data["limits"]
+            if not isinstance(data__limits, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".limits must be object", value=data__limits, name="" + (name_prefix or "data") + ".limits", definition={'type': 'object'}, rule='type')
+    return data
\ No newline at end of file
@@ -21,66 +21,263 @@ python3 analyze_research_query.py \
 python3 analyze_research_query.py \
   --query "Daily AI regulation news" \
   --output /tmp/analysis.json
+
+# Analyze many queries at once (one query per line)
+python3 analyze_research_query.py \
+  --queries-file /tmp/queries.txt \
+  --output /tmp/analyses.json
+
+# Reuse cached classifications for identical or near-identical queries
+OPENAI_CLASSIFY_CACHE=1 python3 analyze_research_query.py \
+  --query "Daily AI regulation news"
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
+import functools
+import hashlib
 import json
+import math
 import os
+import re
+import sqlite3
 import sys
+import time
+from array import array
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+# Add project root to path; strategies and openai are imported on first use
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
 sys.path.insert(0, str(PROJECT_ROOT))
 
 try:
-    from strategies import load_strategy_index, StrategyIndexEntry
-    from openai import OpenAI
+    from pydantic import BaseModel
 except ImportError as e:
     print(f"Error: Missing dependencies: {e}", file=sys.stderr)
     print("Run from project root: /home/user/web_research_agent", file=sys.stderr)
     sys.exit(1)
 
+if TYPE_CHECKING:
+    from strategies import StrategyIndexEntry
+
+
+class RequiredVariable(BaseModel):
+    name: str
+    description: str
+
+
+class QueryClassification(BaseModel):
+    """Structured output schema for classify_query."""
+
+    category: Literal[
+        "news", "general", "company", "financial", "finance",
+        "academic", "legal", "technical", "regulatory", "competitive"
+    ]
+    time_window: Literal["day", "week", "month", "year"]
+    depth: Literal["brief", "overview", "deep", "comprehensive"]
+    required_variables: List[RequiredVariable]
+    suggested_tools: List[Literal[
+        "sonar_search", "exa_search_semantic", "exa_search_keyword",
+        "exa_contents", "exa_answer", "llm_analyzer"
+    ]]
+    domain_hints: List[str]
+    reasoning: str
+
+
+# Classification cache (enabled with OPENAI_CLASSIFY_CACHE=1)
+CLASSIFY_CACHE_PATH = Path(os.getenv(
+    "CLASSIFY_CACHE_PATH",
+    Path.home() / ".cache" / "web_research_agent" / "classify_cache.sqlite"
+))
+CLASSIFY_CACHE_MAX_ROWS = 10_000
+CLASSIFY_CACHE_SIMILARITY = 0.95
+# Most recently used embeddings compared per similarity lookup
+CLASSIFY_CACHE_SCAN_ROWS = 1_000
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Routes classify requests to the same prompt cache shard
+CLASSIFY_PROMPT_CACHE_KEY = "classify_query_v1"
+
+# Indicator words per language for detect_language (checked in this order on ties)
+LANGUAGE_WORDS = {
+    "de": frozenset({'über', 'alle', 'informationen', 'der', 'die', 'das', 'ein', 'eine', 'gerichtsurteile', 'deutschen'}),
+    "es": frozenset({'sobre', 'todos', 'información', 'el', 'la', 'los', 'las', 'un', 'una'}),
+    "fr": frozenset({'sur', 'tous', 'toutes', 'information', 'le', 'la', 'les', 'un', 'une', 'des'}),
+}
+WORD_RE = re.compile(r"\w+")
+
+# py3langid is unreliable on shorter queries; they use the word-list heuristic
+LANGID_MIN_TOKENS = 3
+
+# Research depth ordering used for match scoring
+DEPTH_LEVELS = {"brief": 1, "overview": 2, "deep": 3, "comprehensive": 4}
+
+# Maximum in-flight classification requests in --queries-file mode
+MAX_CONCURRENCY = 20
+
+
+class ClassificationCache:
+    """SQLite-backed classification cache.
+
+    Lookups try an exact key first, then fall back to the most similar cached
+    query embedding with the same frequency/depth context. Least recently used
+    rows are evicted beyond ``max_rows``.
+    """
+
+    def __init__(self, path: Path, max_rows: int = CLASSIFY_CACHE_MAX_ROWS):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_rows = max_rows
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS classify_cache ("
+            "key TEXT PRIMARY KEY, context TEXT, embedding BLOB, payload TEXT, ts REAL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(query: str, frequency: Optional[str], depth: Optional[str]) -> str:
+        return hashlib.sha1(f"{query}|{frequency}|{depth}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            "SELECT payload FROM classify_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._touch(key)
+        return json.loads(row[0])
+
+    def find_similar(
+        self,
+        embedding: List[float],
+        context: str,
+        threshold: float = CLASSIFY_CACHE_SIMILARITY
+    ) -> Optional[Dict[str, Any]]:
+        best_key, best_payload, best_score = None, None, threshold
+        rows = self.conn.execute(
+            "SELECT key, embedding, payload FROM classify_cache "
+            "WHERE context = ? AND embedding IS NOT NULL "
+            "ORDER BY ts DESC LIMIT ?",
+            (context, CLASSIFY_CACHE_SCAN_ROWS)
+        )
+        for key, blob, payload in rows:
+            cached = array('f')
+            cached.frombytes(blob)
+            score = sum(a * b for a, b in zip(embedding, cached))
+            if score > best_score:
+                best_key, best_payload, best_score = key, payload, score
+
+        if best_key is None:
+            return None
+        self._touch(best_key)
+        return json.loads(best_payload)
+
+    def put(
+        self,
+        key: str,
+        context: str,
+        embedding: Optional[List[float]],
+        payload: Dict[str, Any]
+    ):
+        blob = array('f', embedding).tobytes() if embedding else None
+        self.conn.execute(
+            "INSERT OR REPLACE INTO classify_cache VALUES (?, ?, ?, ?, ?)",
+            (key, context, blob, json.dumps(payload), time.time())
+        )
+        self.conn.execute(
+            "DELETE FROM classify_cache WHERE key NOT IN ("
+            "SELECT key FROM classify_cache ORDER BY ts DESC LIMIT ?)",
+            (self.max_rows,)
+        )
+        self.conn.commit()
+
+    def _touch(self, key: str):
+        self.conn.execute(
+            "UPDATE classify_cache SET ts = ? WHERE key = ?", (time.time(), key)
+        )
+        self.conn.commit()
+
+
+@functools.lru_cache(maxsize=1)
+def get_classify_cache() -> Optional[ClassificationCache]:
+    """Return the classification cache, or None unless OPENAI_CLASSIFY_CACHE=1."""
+    if os.getenv("OPENAI_CLASSIFY_CACHE") != "1":
+        return None
+    try:
+        return ClassificationCache(CLASSIFY_CACHE_PATH)
+    except sqlite3.Error as e:
+        print(f"⚠️  Classification cache unavailable: {e}", file=sys.stderr)
+        return None
 
+
+def _unit_vector(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def embed_query(client, query: str) -> Optional[List[float]]:
+    """Return a unit-length embedding for query, or None on API error."""
+    try:
+        response = client.embeddings.create(model=EMBEDDING_MODEL, input=query)
+    except Exception as e:
+        print(f"⚠️  Could not embed query for cache lookup: {e}", file=sys.stderr)
+        return None
+
+    return _unit_vector(response.data[0].embedding)
+
+
+async def embed_query_async(client, query: str) -> Optional[List[float]]:
+    """Async variant of embed_query for an AsyncOpenAI client."""
+    try:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=query)
+    except Exception as e:
+        print(f"⚠️  Could not embed query for cache lookup: {e}", file=sys.stderr)
+        return None
+
+    return _unit_vector(response.data[0].embedding)
+
+
+@functools.lru_cache(maxsize=1)
+def _langid_classifier():
+    """Return py3langid's classify restricted to supported languages, if installed."""
+    try:
+        import py3langid
+    except ImportError:
+        return None
+
+    py3langid.set_languages(list(LANGUAGE_WORDS) + ["en"])
+    return py3langid.classify
+
+
+@functools.lru_cache(maxsize=1024)
 def detect_language(query: str) -> str:
-    """Detect query language (basic heuristic)."""
-    # German indicators
-    german_words = {'über', 'alle', 'informationen', 'der', 'die', 'das', 'ein', 'eine', 'gerichtsurteile', 'deutschen'}
-    query_lower = query.lower()
-    german_matches = sum(1 for word in german_words if word in query_lower)
-
-    # Spanish indicators
-    spanish_words = {'sobre', 'todos', 'información', 'el', 'la', 'los', 'las', 'un', 'una'}
-    spanish_matches = sum(1 for word in spanish_words if word in query_lower)
-
-    # French indicators
-    french_words = {'sur', 'tous', 'toutes', 'information', 'le', 'la', 'les', 'un', 'une', 'des'}
-    french_matches = sum(1 for word in french_words if word in query_lower)
-
-    if german_matches >= 2:
-        return "de"
-    elif spanish_matches >= 2:
-        return "es"
-    elif french_matches >= 2:
-        return "fr"
-    else:
-        return "en"
+    """Detect query language, using py3langid when installed.
 
+    Queries under LANGID_MIN_TOKENS words (e.g. "OpenAI") always use the
+    word-list heuristic, which defaults to English.
+    """
+    if len(WORD_RE.findall(query)) < LANGID_MIN_TOKENS:
+        return detect_language_heuristic(query)
 
-def classify_query(query: str, frequency: Optional[str] = None, depth: Optional[str] = None) -> Dict[str, Any]:
-    """Use LLM to classify research query."""
+    classify = _langid_classifier()
+    if classify is not None:
+        return classify(query.replace("\n", " "))[0]
+    return detect_language_heuristic(query)
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-    # Build prompt
-    prompt = f"""You are a research strategy classifier. Analyze this research query and extract structured information.
+def detect_language_heuristic(query: str) -> str:
+    """Detect query language (basic heuristic)."""
+    tokens = set(WORD_RE.findall(query.lower()))
+    language, words = max(LANGUAGE_WORDS.items(), key=lambda kv: len(kv[1] & tokens))
+    return language if len(words & tokens) >= 2 else "en"
 
-Query: "{query}"
 
-Context:
-- Frequency hint: {frequency or "not specified"}
-- Depth hint: {depth or "not specified"}
+# Static classifier instructions. Kept as the system message so the whole
+# prefix is identical across calls and eligible for OpenAI prompt caching.
+CLASSIFY_SYSTEM_PROMPT = """You are a research strategy expert and classifier. Analyze the research query and extract structured information.
 
 Classify the query into:
 
@@ -120,45 +317,188 @@ Classify the query into:
 
 6. **domain_hints**: Specific domains/sources to prioritize (if applicable)
 
-Return ONLY valid JSON with this structure:
-{{
-  "category": "...",
-  "time_window": "...",
-  "depth": "...",
-  "required_variables": [
-    {{"name": "variable_name", "description": "what it represents"}}
-  ],
-  "suggested_tools": ["tool1", "tool2"],
-  "domain_hints": ["domain1.com", "domain2.com"],
-  "reasoning": "brief explanation of classification"
-}}"""
+7. **reasoning**: brief explanation of classification"""
+
+
+def build_classify_messages(
+    query: str,
+    frequency: Optional[str] = None,
+    depth: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """Build the chat messages for classifying a research query."""
+
+    prompt = f"""Query: "{query}"
+
+Context:
+- Frequency hint: {frequency or "not specified"}
+- Depth hint: {depth or "not specified"}"""
+
+    return [
+        {"role": "system", "content": CLASSIFY_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def fallback_classification(depth: Optional[str] = None) -> Dict[str, Any]:
+    """Simple classification used when the OpenAI call fails."""
+    return {
+        "category": "general",
+        "time_window": "week",
+        "depth": depth or "deep",
+        "required_variables": [{"name": "topic", "description": "Research topic"}],
+        "suggested_tools": ["sonar_search", "exa_search_semantic", "llm_analyzer"],
+        "domain_hints": [],
+        "reasoning": "Fallback classification due to API error"
+    }
+
+
+def parse_classification(response) -> Dict[str, Any]:
+    """Extract the parsed QueryClassification from a completions.parse response."""
+    message = response.choices[0].message
+    if message.parsed is None:
+        raise ValueError(f"No classification returned: {message.refusal or 'empty response'}")
+    return message.parsed.model_dump()
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_client():
+    """Return the OpenAI client, importing the SDK on first use."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+def classify_query(query: str, frequency: Optional[str] = None, depth: Optional[str] = None) -> Dict[str, Any]:
+    """Use LLM to classify research query.
+
+    Exact cache hits return before the OpenAI SDK is imported.
+    """
+
+    # Check cache (exact key, then semantic neighbour)
+    cache = get_classify_cache()
+    cache_key = cache_context = embedding = None
+    if cache:
+        cache_key = cache.make_key(query, frequency, depth)
+        cache_context = f"{frequency}|{depth}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            print("✓ Classification cache hit (exact)", file=sys.stderr)
+            return cached
+
+    client = _openai_client()
+
+    if cache:
+        embedding = embed_query(client, query)
+        if embedding:
+            cached = cache.find_similar(embedding, cache_context)
+            if cached is not None:
+                print("✓ Classification cache hit (similar query)", file=sys.stderr)
+                return cached
 
     try:
-        response = client.chat.completions.create(
+        response = client.chat.completions.parse(
             model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            messages=[
-                {"role": "system", "content": "You are a research strategy expert. Return only valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
+            messages=build_classify_messages(query, frequency, depth),
             temperature=0.3,
-            response_format={"type": "json_object"}
+            response_format=QueryClassification,
+            prompt_cache_key=CLASSIFY_PROMPT_CACHE_KEY
         )
 
-        classification = json.loads(response.choices[0].message.content)
+        classification = parse_classification(response)
+        if cache:
+            cache.put(cache_key, cache_context, embedding, classification)
         return classification
 
     except Exception as e:
         print(f"Error calling OpenAI API: {e}", file=sys.stderr)
-        # Fallback to simple classification
-        return {
-            "category": "general",
-            "time_window": "week",
-            "depth": depth or "deep",
-            "required_variables": [{"name": "topic", "description": "Research topic"}],
-            "suggested_tools": ["sonar_search", "exa_search_semantic", "llm_analyzer"],
-            "domain_hints": [],
-            "reasoning": "Fallback classification due to API error"
-        }
+        return fallback_classification(depth)
+
+
+async def classify_query_async(
+    get_client,
+    query: str,
+    frequency: Optional[str] = None,
+    depth: Optional[str] = None
+) -> Dict[str, Any]:
+    """Async variant of classify_query.
+
+    ``get_client`` returns the shared AsyncOpenAI client; it is only called
+    once the exact-key cache lookup misses.
+    """
+
+    # Check cache (exact key, then semantic neighbour)
+    cache = get_classify_cache()
+    cache_key = cache_context = embedding = None
+    if cache:
+        cache_key = cache.make_key(query, frequency, depth)
+        cache_context = f"{frequency}|{depth}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    client = get_client()
+
+    if cache:
+        embedding = await embed_query_async(client, query)
+        if embedding:
+            cached = cache.find_similar(embedding, cache_context)
+            if cached is not None:
+                return cached
+
+    try:
+        response = await client.chat.completions.parse(
+            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            messages=build_classify_messages(query, frequency, depth),
+            temperature=0.3,
+            response_format=QueryClassification,
+            prompt_cache_key=CLASSIFY_PROMPT_CACHE_KEY
+        )
+
+        classification = parse_classification(response)
+        if cache:
+            cache.put(cache_key, cache_context, embedding, classification)
+        return classification
+
+    except Exception as e:
+        print(f"Error calling OpenAI API for '{query}': {e}", file=sys.stderr)
+        return fallback_classification(depth)
+
+
+# (strategies list, index) for the last list passed to index_strategies
+_STRATEGY_INDEX: Optional[Tuple[List[StrategyIndexEntry], Tuple[Dict, Dict, Dict]]] = None
+
+
+def index_strategies(
+    strategies: List[StrategyIndexEntry]
+) -> Tuple[Dict, Dict, Dict]:
+    """Index active strategies for O(1) matching.
+
+    Returns ``(exact, category_time, category)`` dicts keyed by
+    ``(category, time_window, depth)``, ``(category, time_window)`` and
+    ``category``. The first strategy in list order wins for the first two;
+    the category index holds the highest-priority (lowest value) entry. The
+    index is reused while the same list object is passed in.
+    """
+    global _STRATEGY_INDEX
+    if _STRATEGY_INDEX is not None and _STRATEGY_INDEX[0] is strategies:
+        return _STRATEGY_INDEX[1]
+
+    exact: Dict[Tuple[str, str, str], StrategyIndexEntry] = {}
+    category_time: Dict[Tuple[str, str], StrategyIndexEntry] = {}
+    category: Dict[str, StrategyIndexEntry] = {}
+
+    for strategy in strategies:
+        if not strategy.active:
+            continue
+        exact.setdefault((strategy.category, strategy.time_window, strategy.depth), strategy)
+        category_time.setdefault((strategy.category, strategy.time_window), strategy)
+        best = category.get(strategy.category)
+        if best is None or strategy.priority < best.priority:
+            category[strategy.category] = strategy
+
+    index = (exact, category_time, category)
+    _STRATEGY_INDEX = (strategies, index)
+    return index
 
 
 def find_matching_strategy(
@@ -169,28 +509,15 @@ def find_matching_strategy(
 ) -> Optional[StrategyIndexEntry]:
     """Find existing strategy that matches classification."""
 
-    # Exact match
-    for strategy in strategies:
-        if (strategy.category == category and
-            strategy.time_window == time_window and
-            strategy.depth == depth and
-            strategy.active):
-            return strategy
-
-    # Partial match (category + time_window, flexible on depth)
-    for strategy in strategies:
-        if (strategy.category == category and
-            strategy.time_window == time_window and
-            strategy.active):
-            return strategy
-
-    # Partial match (category only, closest depth/time)
-    category_matches = [s for s in strategies if s.category == category and s.active]
-    if category_matches:
-        # Return highest priority match
-        return sorted(category_matches, key=lambda s: s.priority)[0]
+    exact, category_time, category_best = index_strategies(strategies)
 
-    return None
+    # Exact match, then category + time_window (flexible on depth),
+    # then category only (highest priority)
+    return (
+        exact.get((category, time_window, depth))
+        or category_time.get((category, time_window))
+        or category_best.get(category)
+    )
 
 
 def calculate_match_quality(
@@ -214,9 +541,8 @@ def calculate_match_quality(
         score += 10  # Month can cover shorter periods
 
     # Depth match (30 points)
-    depth_map = {"brief": 1, "overview": 2, "deep": 3, "comprehensive": 4}
-    strat_depth = depth_map.get(strategy.depth, 2)
-    class_depth = depth_map.get(classification["depth"], 2)
+    strat_depth = DEPTH_LEVELS.get(strategy.depth, 2)
+    class_depth = DEPTH_LEVELS.get(classification["depth"], 2)
     depth_diff = abs(strat_depth - class_depth)
     score += max(0, 30 - (depth_diff * 10))
 
@@ -225,33 +551,38 @@ def calculate_match_quality(
 
 def suggest_new_slug(classification: Dict[str, Any]) -> str:
     """Suggest slug for new strategy."""
+    return _suggest_slug(
+        classification["category"],
+        classification.get("reasoning", "").lower(),
+        classification["time_window"],
+        classification["depth"]
+    )
 
-    category = classification["category"]
 
+@functools.lru_cache(maxsize=512)
+def _suggest_slug(category: str, reasoning: str, time_window: str, depth: str) -> str:
     # Extract key topic words from reasoning
-    reasoning = classification.get("reasoning", "").lower()
+    tokens = frozenset(WORD_RE.findall(reasoning))
 
     # Domain-specific slug suggestions
     if category == "legal":
-        if "court" in reasoning or "case" in reasoning:
+        if "court" in tokens or "case" in tokens:
             return f"legal/court_cases"
-        elif "regulation" in reasoning or "compliance" in reasoning:
+        elif "regulation" in tokens or "compliance" in tokens:
             return f"legal/regulatory"
         else:
             return f"legal/general_research"
 
     elif category == "technical":
-        if "documentation" in reasoning:
+        if "documentation" in tokens:
             return f"technical/documentation"
-        elif "how" in reasoning or "guide" in reasoning:
+        elif "how" in tokens or "guide" in tokens:
             return f"technical/guides"
         else:
             return f"technical/research"
 
     elif category in ["news", "general", "financial", "finance", "academic", "company"]:
         # Use existing pattern
-        time_window = classification["time_window"]
-        depth = classification["depth"]
         return f"{category}/{time_window}_{depth}"
 
     else:
@@ -271,18 +602,77 @@ def analyze_query(
     if not language:
         language = detect_language(query)
 
-    # Load existing strategies
+    strategies = load_strategies()
+
+    # Classify query
+    print("Classifying query...", file=sys.stderr)
+    classification = classify_query(query, frequency, depth)
+    classification["language"] = language
+
+    return build_analysis(query, classification, strategies)
+
+
+async def analyze_queries_batch(
+    queries: List[str],
+    frequency: Optional[str] = None,
+    depth: Optional[str] = None,
+    language: Optional[str] = None,
+    max_concurrency: int = MAX_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """Analyze many queries with concurrent classification calls.
+
+    Strategies are loaded once and classifications share one AsyncOpenAI
+    client, bounded by ``max_concurrency`` in-flight requests. The client
+    (and the SDK import) is only created once a query misses the exact cache.
+    """
+    strategies = load_strategies()
+    sem = asyncio.Semaphore(max_concurrency)
+
+    @functools.lru_cache(maxsize=1)
+    def get_client():
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    async def classify_one(query: str) -> Dict[str, Any]:
+        async with sem:
+            return await classify_query_async(get_client, query, frequency, depth)
+
+    print(f"Classifying {len(queries)} queries...", file=sys.stderr)
+    classifications = await asyncio.gather(
+        *(classify_one(q) for q in queries), return_exceptions=True
+    )
+
+    results = []
+    for query, classification in zip(queries, classifications):
+        if isinstance(classification, BaseException):
+            print(f"Error classifying '{query}': {classification}", file=sys.stderr)
+            classification = fallback_classification(depth)
+        classification["language"] = language or detect_language(query)
+        results.append(build_analysis(query, classification, strategies))
+
+    return results
+
+
+def load_strategies() -> List[StrategyIndexEntry]:
+    """Load the strategy index, returning an empty list on failure."""
     try:
+        from strategies import load_strategy_index
+
         strategies = load_strategy_index()
         print(f"✓ Loaded {len(strategies)} existing strategies", file=sys.stderr)
+        return strategies
     except Exception as e:
         print(f"⚠️  Could not load strategies: {e}", file=sys.stderr)
-        strategies = []
+        return []
 
-    # Classify query
-    print("Classifying query...", file=sys.stderr)
-    classification = classify_query(query, frequency, depth)
-    classification["language"] = language
+
+def build_analysis(
+    query: str,
+    classification: Dict[str, Any],
+    strategies: List[StrategyIndexEntry]
+) -> Dict[str, Any]:
+    """Match a classification against existing strategies and recommend next steps."""
 
     # Find matching strategy
     matching_strategy = find_matching_strategy(
@@ -350,10 +740,16 @@ Examples:
 
   # Save output
   %(prog)s --query "Tesla launches" --output /tmp/analysis.json
+
+  # Many queries concurrently (one per line)
+  %(prog)s --queries-file /tmp/queries.txt --output /tmp/analyses.json
         """
     )
 
-    parser.add_argument('--query', required=True, help='Research query to analyze')
+    query_group = parser.add_mutually_exclusive_group(required=True)
+    query_group.add_argument('--query', help='Research query to analyze')
+    query_group.add_argument('--queries-file',
+                            help='File with newline-delimited queries to analyze concurrently')
     parser.add_argument('--frequency', choices=['daily', 'weekly', 'monthly', 'yearly'],
                        help='How often to run the research')
     parser.add_argument('--depth', choices=['brief', 'overview', 'deep', 'comprehensive'],
@@ -365,18 +761,15 @@ Examples:
 
     args = parser.parse_args()
 
-    # Map frequency to time_window
-    frequency_map = {
-        'daily': 'day',
-        'weekly': 'week',
-        'monthly': 'month',
-        'yearly': 'year'
-    }
     depth_arg = args.depth
     if args.frequency:
         # Use frequency as hint for classification
         pass
 
+    if args.queries_file:
+        run_batch(args)
+        return
+
     try:
         result = analyze_query(
             query=args.query,
@@ -424,5 +817,41 @@ Examples:
         sys.exit(1)
 
 
+def run_batch(args):
+    """Analyze every query in args.queries_file and save a JSON array."""
+    try:
+        with open(args.queries_file) as f:
+            queries = [line.strip() for line in f if line.strip()]
+
+        results = asyncio.run(analyze_queries_batch(
+            queries,
+            frequency=args.frequency,
+            depth=args.depth,
+            language=args.language
+        ))
+
+        # Save output
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print("\n" + "="*60)
+        print(f"BATCH QUERY ANALYSIS: {len(results)} queries")
+        print("="*60)
+        for result in results:
+            target = (result['existing_match'] or {}).get('slug') or result.get('suggested_slug', 'N/A')
+            print(f"  [{result['recommendation']}] {result['query']} → {target}")
+
+        print(f"\n✓ Full analysis saved to: {output_path}")
+        print("="*60 + "\n")
+
+    except Exception as e:
+        print(f"\n✗ Error: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -20,120 +20,297 @@ python3 analyze_strategy_performance.py \
 """
 
 import argparse
+import functools
 import json
 import sys
+from array import array
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Sequence, Tuple
 from collections import defaultdict
 from datetime import datetime
 
-def calculate_latencies(traces: List[Dict], observations: Dict[str, List[Dict]]) -> Dict[str, Any]:
-    """Calculate latency statistics."""
-
-    trace_latencies = []
-    phase_latencies = defaultdict(list)
-    tool_latencies = defaultdict(list)
-
-    for trace in traces:
-        # Trace-level latency
-        latency = trace.get('latency')
-        if latency:
-            trace_latencies.append(latency / 1000)  # Convert to seconds
-
-        # Observation-level latencies
-        trace_id = trace['id']
-        if trace_id in observations:
-            for obs in observations[trace_id]:
-                obs_latency = obs.get('latency')
-                if obs_latency:
-                    latency_sec = obs_latency / 1000
-                    obs_name = obs.get('name', 'unknown')
-
-                    # Categorize by phase
-                    if 'scope' in obs_name.lower():
-                        phase_latencies['scope'].append(latency_sec)
-                    elif 'fill' in obs_name.lower():
-                        phase_latencies['fill'].append(latency_sec)
-                    elif 'research' in obs_name.lower() or 'tool' in obs_name.lower():
-                        phase_latencies['research'].append(latency_sec)
-                    elif 'finalize' in obs_name.lower() or 'write' in obs_name.lower():
-                        phase_latencies['finalize'].append(latency_sec)
-
-                    # Tool-specific latencies
-                    tool_latencies[obs_name].append(latency_sec)
-
-    def stats(values):
-        if not values:
-            return None
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; errors fall back to substring checks
+    ahocorasick = None
+
+# Fields read by the analyzers; everything else is dropped when streaming
+TRACE_FIELDS = ('id', 'latency', 'level', 'status_message', 'timestamp')
+OBSERVATION_FIELDS = ('name', 'latency', 'level', 'status_message', 'start_time')
+
+# (message substring, error pattern) pairs in match priority order
+ERROR_PATTERNS = (
+    ('timeout', 'timeout'),
+    ('context length', 'context_length'),
+    ('token', 'context_length'),
+    ('rate limit', 'rate_limit'),
+    ('api', 'api_error'),
+)
+ERROR_PRIORITY = ('timeout', 'context_length', 'rate_limit', 'api_error')
+
+PHASES = ('scope', 'fill', 'research', 'finalize')
+
+# (name substring, phase index into PHASES) pairs in match priority order
+PHASE_TOKENS = (
+    ('scope', 0),
+    ('fill', 1),
+    ('research', 2),
+    ('tool', 2),
+    ('finalize', 3),
+    ('write', 3),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _numpy():
+    """Import numpy on first use; None when not installed (pure-Python stats)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def latency_stats(values: Sequence[float]) -> Dict[str, Any]:
+    """Summarize a sequence of latencies (seconds)."""
+    if len(values) == 0:
+        return None
+
+    np = _numpy()
+    if np is not None:
+        a = np.asarray(values, dtype=np.float64)
+        k50, k95 = a.size // 2, int(a.size * 0.95)
+        part = np.partition(a, (k50, k95))
         return {
-            'avg': round(sum(values) / len(values), 2),
-            'min': round(min(values), 2),
-            'max': round(max(values), 2),
-            'p50': round(sorted(values)[len(values)//2], 2),
-            'p95': round(sorted(values)[int(len(values)*0.95)], 2) if len(values) > 1 else round(values[0], 2),
-            'count': len(values)
+            'avg': round(float(a.mean()), 2),
+            'min': round(float(a.min()), 2),
+            'max': round(float(a.max()), 2),
+            'p50': round(float(part[k50]), 2),
+            'p95': round(float(part[k95]), 2),
+            'count': int(a.size)
         }
 
+    ordered = sorted(values)
     return {
-        'trace_latencies': stats(trace_latencies),
-        'phase_latencies': {phase: stats(latencies) for phase, latencies in phase_latencies.items()},
-        'tool_latencies': {tool: stats(latencies) for tool, latencies in tool_latencies.items()}
+        'avg': round(sum(values) / len(values), 2),
+        'min': round(ordered[0], 2),
+        'max': round(ordered[-1], 2),
+        'p50': round(ordered[len(values)//2], 2),
+        'p95': round(ordered[int(len(values)*0.95)], 2) if len(values) > 1 else round(values[0], 2),
+        'count': len(values)
     }
 
 
-def analyze_errors(traces: List[Dict], observations: Dict[str, List[Dict]]) -> Dict[str, Any]:
-    """Analyze error patterns."""
+def _build_error_automaton():
+    automaton = ahocorasick.Automaton()
+    for pattern, label in ERROR_PATTERNS:
+        automaton.add_word(pattern, label)
+    automaton.make_automaton()
+    return automaton
+
+
+_ERROR_AUTOMATON = _build_error_automaton() if ahocorasick is not None else None
+
+
+def classify_error(message: str) -> str:
+    """Map an error message to an ERROR_PRIORITY pattern name, or 'other'."""
+    msg = (message or '').lower()
+
+    if _ERROR_AUTOMATON is not None:
+        labels = {label for _, label in _ERROR_AUTOMATON.iter(msg)}
+        return next((label for label in ERROR_PRIORITY if label in labels), 'other')
 
+    for pattern, label in ERROR_PATTERNS:
+        if pattern in msg:
+            return label
+    return 'other'
+
+
+def phase_stats(values: Sequence[float], phase_ids: Sequence[int]) -> Dict[str, Dict[str, Any]]:
+    """Summarize latencies grouped by phase index (see PHASES)."""
+    grouped = defaultdict(list)
+    for value, phase_id in zip(values, phase_ids):
+        grouped[PHASES[phase_id]].append(value)
+    return {phase: latency_stats(latencies) for phase, latencies in grouped.items()}
+
+
+def load_traces(traces_file: str) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+    """Load traces and observations from a retrieve_strategy_traces.py bundle.
+
+    With ijson installed the file is streamed one trace / observation list at
+    a time and only the fields used by the analyzers are kept, so large
+    input/output payloads are never all resident at once.
+    """
+    try:
+        import ijson
+    except ImportError:
+        if orjson is not None:
+            data = orjson.loads(Path(traces_file).read_bytes())
+        else:
+            with open(traces_file, 'r') as f:
+                data = json.load(f)
+        return data.get('traces', []), data.get('observations', {})
+
+    with open(traces_file, 'rb') as f:
+        traces = [
+            {k: trace[k] for k in TRACE_FIELDS if k in trace}
+            for trace in ijson.items(f, 'traces.item', use_float=True)
+        ]
+        f.seek(0)
+        observations = {
+            trace_id: [{k: obs[k] for k in OBSERVATION_FIELDS if k in obs} for obs in obs_list]
+            for trace_id, obs_list in ijson.kvitems(f, 'observations', use_float=True)
+        }
+
+    return traces, observations
+
+
+def write_json(path: Path, data: Any):
+    """Write data as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+def walk_traces(traces: List[Dict], observations: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    """Collect latency, error and tool accumulators in a single pass.
+
+    Latency and error data come from observations of the given traces; tool
+    effectiveness covers every observation list, including ones whose trace
+    is not in ``traces``.
+    """
+
+    # Latencies are kept in compact double buffers that NumPy reads without copying
+    trace_latencies = array('d')
+    phase_latencies = array('d')
+    phase_ids = array('b')
+    tool_latencies = defaultdict(lambda: array('d'))
     errors = []
     error_traces = set()
+    error_trace_count = 0
+    tool_stats = defaultdict(lambda: {'success': 0, 'failure': 0, 'latency_sum': 0.0, 'latency_count': 0})
+    visited = set()
+
+    def count_tool(obs, tool_name, latency_sec):
+        stats = tool_stats[tool_name]
+        if obs.get('level', 'DEFAULT') == 'ERROR':
+            stats['failure'] += 1
+        else:
+            stats['success'] += 1
+        if latency_sec is not None:
+            stats['latency_sum'] += latency_sec
+            stats['latency_count'] += 1
 
     for trace in traces:
         trace_id = trace['id']
-        level = trace.get('level', 'DEFAULT')
-        status = trace.get('status_message', '')
 
-        if level == 'ERROR':
+        # Trace-level latency
+        latency = trace.get('latency')
+        if latency:
+            trace_latencies.append(latency / 1000)  # Convert to seconds
+
+        # Trace-level error
+        if trace.get('level', 'DEFAULT') == 'ERROR':
+            error_trace_count += 1
             error_traces.add(trace_id)
             errors.append({
                 'trace_id': trace_id,
                 'level': 'trace',
-                'message': status,
+                'message': trace.get('status_message', ''),
                 'timestamp': trace.get('timestamp')
             })
 
-        # Check observations
-        if trace_id in observations:
-            for obs in observations[trace_id]:
-                obs_level = obs.get('level', 'DEFAULT')
-                if obs_level in ['ERROR', 'WARNING']:
-                    error_traces.add(trace_id)
-                    errors.append({
-                        'trace_id': trace_id,
-                        'level': obs_level.lower(),
-                        'phase': obs.get('name', 'unknown'),
-                        'message': obs.get('status_message', ''),
-                        'timestamp': obs.get('start_time')
-                    })
+        if trace_id not in observations:
+            continue
+
+        # Each observation list counts once towards tool effectiveness
+        count_tools = trace_id not in visited
+        visited.add(trace_id)
+
+        for obs in observations[trace_id]:
+            obs_name = obs.get('name', 'unknown')
+            obs_latency = obs.get('latency')
+            latency_sec = obs_latency / 1000 if obs_latency else None
+
+            if latency_sec is not None:
+                # Categorize by phase (first matching token wins)
+                name_lc = obs_name.lower()
+                for token, phase_id in PHASE_TOKENS:
+                    if token in name_lc:
+                        phase_latencies.append(latency_sec)
+                        phase_ids.append(phase_id)
+                        break
+
+                # Tool-specific latencies
+                tool_latencies[obs_name].append(latency_sec)
+
+            obs_level = obs.get('level', 'DEFAULT')
+            if obs_level in ['ERROR', 'WARNING']:
+                error_traces.add(trace_id)
+                errors.append({
+                    'trace_id': trace_id,
+                    'level': obs_level.lower(),
+                    'phase': obs_name,
+                    'message': obs.get('status_message', ''),
+                    'timestamp': obs.get('start_time')
+                })
+
+            if count_tools:
+                count_tool(obs, obs_name, latency_sec)
+
+    # Observations whose trace is not in the trace list
+    for trace_id, obs_list in observations.items():
+        if trace_id in visited:
+            continue
+        for obs in obs_list:
+            obs_latency = obs.get('latency')
+            count_tool(obs, obs.get('name', 'unknown'), obs_latency / 1000 if obs_latency else None)
+
+    return {
+        'trace_count': len(traces),
+        'trace_latencies': trace_latencies,
+        'phase_latencies': phase_latencies,
+        'phase_ids': phase_ids,
+        'tool_latencies': tool_latencies,
+        'errors': errors,
+        'error_traces': error_traces,
+        'error_trace_count': error_trace_count,
+        'tool_stats': tool_stats
+    }
+
+
+def latency_report(walk: Dict[str, Any]) -> Dict[str, Any]:
+    """Build latency statistics from walk_traces output."""
+    return {
+        'trace_latencies': latency_stats(walk['trace_latencies']),
+        'phase_latencies': phase_stats(walk['phase_latencies'], walk['phase_ids']),
+        'tool_latencies': {tool: latency_stats(latencies) for tool, latencies in walk['tool_latencies'].items()}
+    }
+
+
+def error_report(walk: Dict[str, Any]) -> Dict[str, Any]:
+    """Build error pattern analysis from walk_traces output."""
+    errors = walk['errors']
+    trace_count = walk['trace_count']
 
     # Group errors by type
     error_patterns = defaultdict(list)
     for error in errors:
-        msg = error.get('message', '').lower()
-        if 'timeout' in msg:
-            error_patterns['timeout'].append(error)
-        elif 'context length' in msg or 'token' in msg:
-            error_patterns['context_length'].append(error)
-        elif 'rate limit' in msg:
-            error_patterns['rate_limit'].append(error)
-        elif 'api' in msg:
-            error_patterns['api_error'].append(error)
-        else:
-            error_patterns['other'].append(error)
+        error_patterns[classify_error(error.get('message', ''))].append(error)
 
     return {
         'total_errors': len(errors),
-        'affected_traces': len(error_traces),
-        'error_rate': round(len(error_traces) / len(traces) * 100, 1) if traces else 0,
+        'affected_traces': len(walk['error_traces']),
+        'error_rate': round(len(walk['error_traces']) / trace_count * 100, 1) if trace_count else 0,
         'error_patterns': {
             pattern: {
                 'count': len(errs),
@@ -144,33 +321,15 @@ def analyze_errors(traces: List[Dict], observations: Dict[str, List[Dict]]) -> D
     }
 
 
-def analyze_tool_effectiveness(observations: Dict[str, List[Dict]]) -> Dict[str, Any]:
-    """Analyze which tools are performing well."""
-
-    tool_stats = defaultdict(lambda: {'success': 0, 'failure': 0, 'latencies': []})
-
-    for trace_id, obs_list in observations.items():
-        for obs in obs_list:
-            tool_name = obs.get('name', 'unknown')
-            level = obs.get('level', 'DEFAULT')
-            latency = obs.get('latency')
-
-            if level == 'ERROR':
-                tool_stats[tool_name]['failure'] += 1
-            else:
-                tool_stats[tool_name]['success'] += 1
-
-            if latency:
-                tool_stats[tool_name]['latencies'].append(latency / 1000)
-
-    # Calculate success rates
-    tool_report = {}
-    for tool, stats in tool_stats.items():
+def tool_report(walk: Dict[str, Any]) -> Dict[str, Any]:
+    """Build per-tool success rates from walk_traces output."""
+    report = {}
+    for tool, stats in walk['tool_stats'].items():
         total = stats['success'] + stats['failure']
         success_rate = (stats['success'] / total * 100) if total > 0 else 0
-        avg_latency = sum(stats['latencies']) / len(stats['latencies']) if stats['latencies'] else 0
+        avg_latency = stats['latency_sum'] / stats['latency_count'] if stats['latency_count'] else 0
 
-        tool_report[tool] = {
+        report[tool] = {
             'success_count': stats['success'],
             'failure_count': stats['failure'],
             'total_calls': total,
@@ -178,7 +337,22 @@ def analyze_tool_effectiveness(observations: Dict[str, List[Dict]]) -> Dict[str,
             'avg_latency_sec': round(avg_latency, 2)
         }
 
-    return tool_report
+    return report
+
+
+def calculate_latencies(traces: List[Dict], observations: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    """Calculate latency statistics."""
+    return latency_report(walk_traces(traces, observations))
+
+
+def analyze_errors(traces: List[Dict], observations: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    """Analyze error patterns."""
+    return error_report(walk_traces(traces, observations))
+
+
+def analyze_tool_effectiveness(observations: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    """Analyze which tools are performing well."""
+    return tool_report(walk_traces([], observations))
 
 
 def generate_recommendations(
@@ -256,11 +430,7 @@ def analyze_performance(
     """Main analysis function."""
 
     # Load traces
-    with open(traces_file, 'r') as f:
-        data = json.load(f)
-
-    traces = data.get('traces', [])
-    observations = data.get('observations', {})
+    traces, observations = load_traces(traces_file)
 
     if not traces:
         return {
@@ -270,6 +440,9 @@ def analyze_performance(
 
     print(f"Analyzing {len(traces)} traces for strategy '{strategy_slug}'...")
 
+    # One pass over all traces feeds the summary and every requested analysis
+    walk = walk_traces(traces, observations)
+
     # Calculate metrics
     result = {
         'strategy_slug': strategy_slug,
@@ -277,22 +450,22 @@ def analyze_performance(
         'trace_count': len(traces),
         'summary': {
             'total_traces': len(traces),
-            'success_traces': len([t for t in traces if t.get('level') != 'ERROR']),
-            'error_traces': len([t for t in traces if t.get('level') == 'ERROR']),
+            'success_traces': len(traces) - walk['error_trace_count'],
+            'error_traces': walk['error_trace_count'],
         }
     }
 
     if focus in ['all', 'latency']:
         print("  Calculating latencies...")
-        result['latencies'] = calculate_latencies(traces, observations)
+        result['latencies'] = latency_report(walk)
 
     if focus in ['all', 'errors']:
         print("  Analyzing errors...")
-        result['errors'] = analyze_errors(traces, observations)
+        result['errors'] = error_report(walk)
 
     if focus in ['all', 'tools', 'tool_effectiveness']:
         print("  Analyzing tool effectiveness...")
-        result['tool_effectiveness'] = analyze_tool_effectiveness(observations)
+        result['tool_effectiveness'] = tool_report(walk)
 
     if focus == 'all':
         print("  Generating recommendations...")
@@ -339,8 +512,7 @@ Examples:
         # Save output
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        write_json(output_path, result)
 
         # Print summary
         print("\n" + "="*60)
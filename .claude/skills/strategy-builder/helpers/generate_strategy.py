@@ -23,10 +23,12 @@ python3 generate_strategy.py \
 """
 
 import argparse
+import functools
 import json
-import yaml
+import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
 TOOL_TEMPLATES = {
     'sonar_search': {
@@ -83,39 +85,223 @@ TOOL_TEMPLATES = {
     }
 }
 
-DOMAIN_SUGGESTIONS = {
-    'legal': [
-        'bundesverfassungsgericht.de',
-        'bundesgerichtshof.de',
-        'juris.de',
-        'beck-online.de'
-    ],
-    'financial': [
-        'bloomberg.com',
-        'reuters.com',
-        'wsj.com',
-        'ft.com',
-        'cnbc.com',
-        'marketwatch.com'
-    ],
-    'academic': [
-        'arxiv.org',
-        'scholar.google.com',
-        'pubmed.ncbi.nlm.nih.gov',
-        'sciencedirect.com'
-    ],
-    'technical': [
-        'stackoverflow.com',
-        'github.com',
-        'docs.python.org',
-        'developer.mozilla.org'
-    ],
-    'news': [
-        'reuters.com',
-        'apnews.com',
-        'bbc.com',
-        'nytimes.com'
-    ]
+class CategoryConfig(NamedTuple):
+    """Category-specific prompts and domain suggestions for generated strategies."""
+    system_prompt: str
+    synthesis: str
+    default_domains: Tuple[str, ...]
+
+
+# Prompts for categories without a registry entry (and for missing fields)
+DEFAULT_SYSTEM_PROMPT = "You are a {category} research specialist. Provide comprehensive, factual information."
+DEFAULT_SYNTHESIS_PROMPT = "Create a comprehensive {category} report with relevant sections and sources"
+
+
+@functools.lru_cache(maxsize=256)
+def default_category_config(category: str) -> CategoryConfig:
+    """Build the generic config for a category from the default prompts."""
+    return CategoryConfig(
+        system_prompt=DEFAULT_SYSTEM_PROMPT.format(category=category),
+        synthesis=DEFAULT_SYNTHESIS_PROMPT.format(category=category),
+        default_domains=()
+    )
+
+
+CATEGORY_REGISTRY = {
+    'legal': CategoryConfig(
+        system_prompt="You are a legal research assistant. Focus on court cases, legislation, legal precedents, and statutory references.",
+        synthesis="Create a legal analysis with: 1) Legal Summary, 2) Relevant Cases, 3) Statutory Basis, 4) Practice Notes, 5) Sources",
+        default_domains=(
+            'bundesverfassungsgericht.de',
+            'bundesgerichtshof.de',
+            'juris.de',
+            'beck-online.de'
+        )
+    ),
+    'financial': CategoryConfig(
+        system_prompt="You are a financial analyst. Focus on quantitative data, market movements, earnings reports, and financial metrics.",
+        synthesis="Create a financial briefing with: 1) Market Summary, 2) Key Financial News, 3) Earnings & Metrics, 4) Analyst Views, 5) Sources",
+        default_domains=(
+            'bloomberg.com',
+            'reuters.com',
+            'wsj.com',
+            'ft.com',
+            'cnbc.com',
+            'marketwatch.com'
+        )
+    ),
+    'academic': CategoryConfig(
+        system_prompt="You are an academic researcher. Focus on peer-reviewed papers, research methodology, and scholarly citations.",
+        synthesis="Create a research summary with: 1) Overview, 2) Key Findings, 3) Methodology, 4) Implications, 5) Citations",
+        default_domains=(
+            'arxiv.org',
+            'scholar.google.com',
+            'pubmed.ncbi.nlm.nih.gov',
+            'sciencedirect.com'
+        )
+    ),
+    'technical': default_category_config('technical')._replace(
+        system_prompt="You are a technical documentation expert. Focus on implementation details, code examples, and best practices.",
+        default_domains=(
+            'stackoverflow.com',
+            'github.com',
+            'docs.python.org',
+            'developer.mozilla.org'
+        )
+    ),
+    'news': default_category_config('news')._replace(
+        default_domains=(
+            'reuters.com',
+            'apnews.com',
+            'bbc.com',
+            'nytimes.com'
+        )
+    )
+}
+
+
+def category_config(category: str) -> CategoryConfig:
+    """Return the registered config for a category, or the generic default."""
+    return CATEGORY_REGISTRY.get(category) or default_category_config(category)
+
+
+# Query templates; {topic_var} becomes a {{variable}} placeholder in the strategy
+QUERY_TEMPLATES = {
+    'sonar': "{{{{{topic_var}}}}} {category} research",
+    'exa_search': "{{{{{topic_var}}}}} {category}"
+}
+
+
+# Default limits.max_results per research depth
+DEPTH_MAX_RESULTS = {
+    'brief': 10,
+    'overview': 15,
+    'deep': 20,
+    'comprehensive': 25
+}
+
+
+class StepContext(NamedTuple):
+    """Strategy parameters shared by the tool step builders.
+
+    Hashable so step builders can be memoized on (tool, ctx).
+    """
+    category: str
+    time_window: str
+    depth: str
+    domain_hints: Optional[Tuple[str, ...]]
+
+
+@functools.lru_cache(maxsize=1)
+def _strategy_dumper():
+    """Return a YAML dumper that never emits anchors for shared (memoized) sub-dicts.
+
+    yaml is imported here so that --help and argument errors skip its import cost.
+    """
+    try:
+        from yaml import CSafeDumper as BaseDumper  # libyaml C emitter
+    except ImportError:
+        from yaml import SafeDumper as BaseDumper
+
+    class StrategyDumper(BaseDumper):
+        def ignore_aliases(self, data):
+            return True
+
+    return StrategyDumper
+
+
+# Step builders are memoized and return shared dicts; treat them as read-only.
+
+@functools.lru_cache(maxsize=256)
+def _sonar_step(tool: str, ctx: StepContext) -> Dict[str, Any]:
+    """Build a Sonar search step with a category-specific system prompt."""
+    tool_step = {
+        'name': f'sonar_{ctx.category}',
+        'params': {
+            'max_results': 10 if ctx.depth in ['brief', 'overview'] else 15,
+            'system_prompt': category_config(ctx.category).system_prompt,
+            'search_mode': 'web',
+            'search_recency_filter': ctx.time_window,
+            'temperature': 0.1,
+            'max_tokens': 2000
+        }
+    }
+
+    # Add domain filter if available
+    domains = ctx.domain_hints or category_config(ctx.category).default_domains
+    if domains:
+        tool_step['params']['search_domain_filter'] = list(domains)
+
+    return tool_step
+
+
+@functools.lru_cache(maxsize=256)
+def _exa_search_step(tool: str, ctx: StepContext) -> Dict[str, Any]:
+    """Build an Exa semantic or keyword search step."""
+    tool_step = {
+        'name': tool,
+        'params': {
+            'num_results': 10 if ctx.depth in ['brief', 'overview'] else 15,
+            'use_autoprompt': True,
+            'type': 'neural' if 'semantic' in tool else 'keyword',
+            'start_published_date': '{{start_date}}',
+            'end_published_date': '{{end_date}}'
+        }
+    }
+
+    # Add domain inclusions
+    if ctx.domain_hints:
+        tool_step['params']['include_domains'] = list(ctx.domain_hints[:5])  # Limit to 5
+
+    return tool_step
+
+
+def _static_step(tool: str, ctx: StepContext) -> Dict[str, Any]:
+    """Return a step that does not depend on the strategy parameters."""
+    return STATIC_STEPS[tool]
+
+
+@functools.lru_cache(maxsize=256)
+def _llm_analyzer_step(tool: str, ctx: StepContext) -> Dict[str, Any]:
+    """Build the finalize-phase synthesis step."""
+    return {
+        'name': 'llm_analyzer',
+        'phase': 'finalize',
+        'params': {
+            'system_prompt': category_config(ctx.category).synthesis,
+            'temperature': 0.2,
+            'max_tokens': 2500
+        }
+    }
+
+
+# Steps that are identical for every strategy
+STATIC_STEPS = MappingProxyType({
+    'exa_contents': {
+        'name': 'exa_contents',
+        'params': {
+            'num_results': 5,
+            'text': True
+        }
+    },
+    'exa_answer': {
+        'name': 'exa_answer',
+        'params': {
+            'include_source_text': True
+        }
+    }
+})
+
+# Tool name -> step builder; unknown tools are skipped
+STEP_HANDLERS = {
+    'sonar': _sonar_step,
+    'sonar_search': _sonar_step,
+    'exa_search_semantic': _exa_search_step,
+    'exa_search_keyword': _exa_search_step,
+    'exa_contents': _static_step,
+    'exa_answer': _static_step,
+    'llm_analyzer': _llm_analyzer_step,
+    'llm_synthesis': _llm_analyzer_step
 }
 
 
@@ -144,112 +330,17 @@ def generate_strategy_yaml(
     queries = {}
     topic_var = required_vars[0] if required_vars else 'topic'
     if 'sonar' in tools or 'sonar_search' in tools:
-        queries['sonar'] = f"{{{{{topic_var}}}}} {category} research"
+        queries['sonar'] = QUERY_TEMPLATES['sonar'].format(topic_var=topic_var, category=category)
     if 'exa' in tools or 'exa_search_semantic' in tools:
-        queries['exa_search'] = f"{{{{{topic_var}}}}} {category}"
+        queries['exa_search'] = QUERY_TEMPLATES['exa_search'].format(topic_var=topic_var, category=category)
 
     # Build tool chain
-    tool_chain = []
-    for i, tool in enumerate(tools, 1):
-        tool_name = tool.replace('_', ' ').title().replace(' ', '')
-
-        if tool in ['sonar', 'sonar_search']:
-            # Build system prompt based on category
-            if category == 'legal':
-                system_prompt = "You are a legal research assistant. Focus on court cases, legislation, legal precedents, and statutory references."
-            elif category == 'financial':
-                system_prompt = "You are a financial analyst. Focus on quantitative data, market movements, earnings reports, and financial metrics."
-            elif category == 'academic':
-                system_prompt = "You are an academic researcher. Focus on peer-reviewed papers, research methodology, and scholarly citations."
-            elif category == 'technical':
-                system_prompt = "You are a technical documentation expert. Focus on implementation details, code examples, and best practices."
-            else:
-                system_prompt = f"You are a {category} research specialist. Provide comprehensive, factual information."
-
-            tool_step = {
-                'name': f'sonar_{category}',
-                'params': {
-                    'max_results': 10 if depth in ['brief', 'overview'] else 15,
-                    'system_prompt': system_prompt,
-                    'search_mode': 'web',
-                    'search_recency_filter': time_window,
-                    'temperature': 0.1,
-                    'max_tokens': 2000
-                }
-            }
-
-            # Add domain filter if available
-            if domain_hints or category in DOMAIN_SUGGESTIONS:
-                domains = domain_hints or DOMAIN_SUGGESTIONS.get(category, [])
-                tool_step['params']['search_domain_filter'] = domains
-
-            tool_chain.append(tool_step)
-
-        elif tool in ['exa_search_semantic', 'exa_search_keyword']:
-            tool_step = {
-                'name': tool,
-                'params': {
-                    'num_results': 10 if depth in ['brief', 'overview'] else 15,
-                    'use_autoprompt': True,
-                    'type': 'neural' if 'semantic' in tool else 'keyword',
-                    'start_published_date': '{{start_date}}',
-                    'end_published_date': '{{end_date}}'
-                }
-            }
-
-            # Add domain inclusions
-            if domain_hints:
-                tool_step['params']['include_domains'] = domain_hints[:5]  # Limit to 5
-
-            tool_chain.append(tool_step)
-
-        elif tool == 'exa_contents':
-            tool_chain.append({
-                'name': 'exa_contents',
-                'params': {
-                    'num_results': 5,
-                    'text': True
-                }
-            })
-
-        elif tool == 'exa_answer':
-            tool_chain.append({
-                'name': 'exa_answer',
-                'params': {
-                    'include_source_text': True
-                }
-            })
-
-        elif tool in ['llm_analyzer', 'llm_synthesis']:
-            # Build synthesis prompt
-            if category == 'legal':
-                synthesis = "Create a legal analysis with: 1) Legal Summary, 2) Relevant Cases, 3) Statutory Basis, 4) Practice Notes, 5) Sources"
-            elif category == 'financial':
-                synthesis = "Create a financial briefing with: 1) Market Summary, 2) Key Financial News, 3) Earnings & Metrics, 4) Analyst Views, 5) Sources"
-            elif category == 'academic':
-                synthesis = "Create a research summary with: 1) Overview, 2) Key Findings, 3) Methodology, 4) Implications, 5) Citations"
-            else:
-                synthesis = f"Create a comprehensive {category} report with relevant sections and sources"
-
-            tool_chain.append({
-                'name': 'llm_analyzer',
-                'phase': 'finalize',
-                'params': {
-                    'system_prompt': synthesis,
-                    'temperature': 0.2,
-                    'max_tokens': 2500
-                }
-            })
+    ctx = StepContext(category, time_window, depth, tuple(domain_hints) if domain_hints else None)
+    tool_chain = [STEP_HANDLERS[tool](tool, ctx) for tool in tools if tool in STEP_HANDLERS]
 
     # Limits
-    max_results_map = {
-        'brief': 10,
-        'overview': 15,
-        'deep': 20,
-        'comprehensive': 25
-    }
     limits = {
-        'max_results': max_results_map.get(depth, 20),
+        'max_results': DEPTH_MAX_RESULTS.get(depth, 20),
         'max_llm_queries': 2 if depth in ['brief', 'overview'] else 3
     }
 
@@ -262,7 +353,8 @@ def generate_strategy_yaml(
     }
 
     # Convert to YAML
-    yaml_content = yaml.dump(strategy, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    import yaml
+    yaml_content = yaml.dump(strategy, Dumper=_strategy_dumper(), default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     return yaml_content
 
@@ -28,26 +28,108 @@ python3 retrieve_strategy_traces.py \
   --strategy "daily_news_briefing" \
   --filter-essential \
   --output /tmp/traces.json
+
+# Refetch days already in the day cache (~/.cache/strategy_traces)
+python3 retrieve_strategy_traces.py --strategy "daily_news_briefing" --rebuild
+
+STRATEGY FILTER:
+================
+Traces are matched client-side on metadata.strategy_slug. Once every trace
+from a given date on carries the strategy:<slug> tag (set by the scope node),
+export STRATEGY_TAG_SINCE=YYYY-MM-DD so windows from that date are filtered
+server-side by tag instead.
 """
 
 import argparse
+import functools
+import gzip
+import hashlib
 import json
+import os
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime, timedelta
+from typing import List
+from datetime import date, datetime, time, timedelta
 
-# Add project root and langfuse-optimization helpers to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
+# Langfuse helpers are imported lazily so --help does not pay the SDK import cost
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
 LANGFUSE_HELPERS = PROJECT_ROOT / ".claude/skills/langfuse-optimization/helpers"
-sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(LANGFUSE_HELPERS))
 
-try:
-    from langfuse_client import get_langfuse_client
-except ImportError as e:
-    print(f"Error: Could not import langfuse helpers: {e}", file=sys.stderr)
-    print(f"Expected path: {LANGFUSE_HELPERS}", file=sys.stderr)
-    sys.exit(1)
+# Completed past days are cached here, one gzipped JSON file per (slug, day)
+CACHE_DIR = Path(os.getenv("STRATEGY_TRACES_CACHE_DIR", Path.home() / ".cache/strategy_traces"))
+
+# First day (YYYY-MM-DD) whose traces all carry the strategy:<slug> tag.
+# Earlier windows, or all windows when unset, fall back to matching
+# metadata.strategy_slug client-side so untagged traces are not dropped.
+STRATEGY_TAG_SINCE = os.getenv("STRATEGY_TAG_SINCE")
+
+# Maximum concurrent observations.list calls per page of traces
+MAX_WORKERS = 16
+
+# Fields kept by filter_essential_fields
+TRACE_FIELDS = (
+    'id', 'name', 'timestamp', 'metadata', 'input', 'output',
+    'latency', 'level', 'status_message'
+)
+OBSERVATION_FIELDS = (
+    'id', 'trace_id', 'name', 'type', 'start_time', 'end_time', 'latency',
+    'level', 'status_message', 'metadata', 'input', 'output'
+)
+_trace_values = itemgetter(*TRACE_FIELDS)
+_observation_values = itemgetter(*OBSERVATION_FIELDS)
+
+
+def build_http_client():
+    """Build a pooled keep-alive httpx client for the Langfuse SDK transport.
+
+    HTTP/2 is enabled when the optional ``h2`` package is installed so that
+    concurrent observation fetches share one TCP+TLS connection.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=MAX_WORKERS * 2)
+    )
+
+
+def _import_client_factory():
+    """Import get_langfuse_client from the langfuse-optimization helpers."""
+    for path in (PROJECT_ROOT, LANGFUSE_HELPERS):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    try:
+        from langfuse_client import get_langfuse_client
+    except ImportError as e:
+        print(f"Error: Could not import langfuse helpers: {e}", file=sys.stderr)
+        print(f"Expected path: {LANGFUSE_HELPERS}", file=sys.stderr)
+        sys.exit(1)
+
+    return get_langfuse_client
+
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    """Return the process-wide Langfuse client, created on first use."""
+    get_langfuse_client = _import_client_factory()
+    return get_langfuse_client(httpx_client=build_http_client())
 
 
 def parse_time_range(days=None, start_date=None, end_date=None):
@@ -67,124 +149,207 @@ def parse_time_range(days=None, start_date=None, end_date=None):
         return start, end
 
 
-def filter_essential_fields(trace_data):
-    """Strip large fields from trace data for size reduction."""
+def _select_fields(record, fields, getter):
+    """Copy fields from record, filling any missing ones with None."""
+    try:
+        return dict(zip(fields, getter(record)))
+    except KeyError:
+        return {key: record.get(key) for key in fields}
 
-    def clean_trace(trace):
-        """Clean a single trace."""
-        cleaned = {
-            'id': trace.get('id'),
-            'name': trace.get('name'),
-            'timestamp': trace.get('timestamp'),
-            'metadata': trace.get('metadata'),
-            'input': trace.get('input'),
-            'output': trace.get('output'),
-            'latency': trace.get('latency'),
-            'level': trace.get('level'),
-            'status_message': trace.get('status_message'),
-        }
 
-        # Strip large output fields
-        if isinstance(cleaned.get('output'), dict):
-            output = cleaned['output']
-            # Keep only essential fields
-            if 'facts_pack' in output:
-                # Replace with summary
-                facts = output['facts_pack']
-                output['facts_pack'] = {
-                    '_stripped': True,
-                    'count': len(facts) if isinstance(facts, list) else 0,
-                    'size_kb': len(str(facts)) // 1024 if facts else 0
-                }
-            if 'validation_report' in output:
-                # Replace with summary
-                report = output['validation_report']
-                output['validation_report'] = {
-                    '_stripped': True,
-                    'failed_checks': [c.get('name', 'unknown') for c in report.get('failed', [])[:5]] if isinstance(report, dict) else []
-                }
+def clean_trace(trace):
+    """Keep essential trace fields and summarize facts_pack/validation_report."""
+    cleaned = _select_fields(trace, TRACE_FIELDS, _trace_values)
 
+    # Most traces carry neither blob; skip the summary work for them
+    output = cleaned['output']
+    if not isinstance(output, dict) or not ('facts_pack' in output or 'validation_report' in output):
         return cleaned
 
-    def clean_observation(obs):
-        """Clean a single observation."""
-        cleaned = {
-            'id': obs.get('id'),
-            'trace_id': obs.get('trace_id'),
-            'name': obs.get('name'),
-            'type': obs.get('type'),
-            'start_time': obs.get('start_time'),
-            'end_time': obs.get('end_time'),
-            'latency': obs.get('latency'),
-            'level': obs.get('level'),
-            'status_message': obs.get('status_message'),
-            'metadata': obs.get('metadata'),
-            'input': obs.get('input'),
-            'output': obs.get('output'),
+    # Keep only essential fields
+    if 'facts_pack' in output:
+        # Replace with summary
+        facts = output['facts_pack']
+        output['facts_pack'] = {
+            '_stripped': True,
+            'count': len(facts) if isinstance(facts, list) else 0,
+            'size_kb': len(str(facts)) // 1024 if facts else 0
+        }
+    if 'validation_report' in output:
+        # Replace with summary
+        report = output['validation_report']
+        output['validation_report'] = {
+            '_stripped': True,
+            'failed_checks': [c.get('name', 'unknown') for c in report.get('failed', [])[:5]] if isinstance(report, dict) else []
         }
 
-        # Strip large fields from output
-        if isinstance(cleaned.get('output'), dict):
-            output = cleaned['output']
-            # Evidence summaries instead of full content
-            if 'evidence' in output:
-                evidence = output['evidence']
-                if isinstance(evidence, list):
-                    output['evidence'] = {
-                        '_stripped': True,
-                        'count': len(evidence),
-                        'tools_used': list(set(e.get('tool') for e in evidence if e.get('tool')))
-                    }
+    return cleaned
 
+
+def clean_observation(obs):
+    """Keep essential observation fields and summarize evidence lists."""
+    cleaned = _select_fields(obs, OBSERVATION_FIELDS, _observation_values)
+
+    # Most observations (LLM/HTTP spans) have compact outputs; only
+    # evidence lists need summarizing
+    output = cleaned['output']
+    if not isinstance(output, dict) or not isinstance(output.get('evidence'), list):
         return cleaned
 
+    # Evidence summaries instead of full content
+    evidence = output['evidence']
+    output['evidence'] = {
+        '_stripped': True,
+        'count': len(evidence),
+        'tools_used': list(set(e.get('tool') for e in evidence if e.get('tool')))
+    }
+
+    return cleaned
+
+
+def filter_essential_fields(trace_data):
+    """Strip large fields from trace data for size reduction."""
+
     # Clean traces
     if 'traces' in trace_data:
         trace_data['traces'] = [clean_trace(t) for t in trace_data['traces']]
 
     # Clean observations
     if 'observations' in trace_data:
-        cleaned_obs = {}
-        for trace_id, obs_list in trace_data['observations'].items():
-            cleaned_obs[trace_id] = [clean_observation(o) for o in obs_list]
-        trace_data['observations'] = cleaned_obs
+        trace_data['observations'] = {
+            trace_id: [clean_observation(o) for o in obs_list]
+            for trace_id, obs_list in trace_data['observations'].items()
+        }
 
     return trace_data
 
 
-def retrieve_strategy_traces(
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model):
+    """Return a pydantic v2 TypeAdapter for List[model], or None if unavailable."""
+    try:
+        from pydantic import BaseModel, TypeAdapter
+    except ImportError:
+        return None
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return None
+    return TypeAdapter(List[model])
+
+
+def dump_models(items) -> list:
+    """Convert Langfuse API models to dicts in one pass.
+
+    Uses a pydantic v2 TypeAdapter when the SDK models support it, with the
+    same by_alias/exclude_unset defaults as the SDK's .dict(); falls back to
+    per-item .dict() for v1 models and passes plain dicts through.
+    """
+    items = list(items)
+    if not items or not hasattr(items[0], 'dict'):
+        return items
+
+    adapter = _list_adapter(type(items[0]))
+    if adapter is not None:
+        try:
+            return adapter.dump_python(items, by_alias=True, exclude_unset=True)
+        except Exception:
+            pass  # mixed model types; fall back to per-item dumps
+    return [item.dict() if hasattr(item, 'dict') else item for item in items]
+
+
+def fetch_observations(client, trace_ids: list) -> dict:
+    """Fetch observations for several traces concurrently.
+
+    Returns a mapping of trace ID to observation dicts. Traces whose
+    observations could not be fetched are left out with a warning.
+    """
+    observations = {}
+    if not trace_ids:
+        return observations
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(trace_ids))) as executor:
+        futures = {
+            executor.submit(client.api.observations.list, trace_id=trace_id): trace_id
+            for trace_id in trace_ids
+        }
+        for future in as_completed(futures):
+            trace_id = futures[future]
+            try:
+                obs_response = future.result()
+            except Exception as e:
+                print(f"  Warning: Could not retrieve observations for trace {trace_id}: {e}", file=sys.stderr)
+                continue
+            if hasattr(obs_response, 'data'):
+                observations[trace_id] = dump_models(obs_response.data)
+
+    return observations
+
+
+def fetch_error_trace_ids(client, start_time: datetime, end_time: datetime) -> set:
+    """Return IDs of traces with at least one ERROR-level observation in a window.
+
+    One paginated, server-side filtered query replaces a per-trace
+    observations.list call.
+    """
+    trace_ids = set()
+    page = 1
+
+    while True:
+        obs_response = client.api.observations.list(
+            level='ERROR',
+            from_start_time=start_time,
+            to_start_time=end_time,
+            limit=100,
+            page=page
+        )
+        data = getattr(obs_response, 'data', None) or []
+        for obs in data:
+            if isinstance(obs, dict):
+                trace_id = obs.get('trace_id') or obs.get('traceId')
+            else:
+                trace_id = getattr(obs, 'trace_id', None)
+            if trace_id:
+                trace_ids.add(trace_id)
+
+        if len(data) < 100:
+            break
+        page += 1
+
+    return trace_ids
+
+
+def filter_by_tag(start_time: datetime) -> bool:
+    """Whether a window starting at start_time can be filtered by strategy tag."""
+    return (
+        STRATEGY_TAG_SINCE is not None
+        and start_time >= datetime.fromisoformat(STRATEGY_TAG_SINCE)
+    )
+
+
+def fetch_traces(
+    client,
     strategy_slug: str,
-    days: int = 7,
-    start_date: str = None,
-    end_date: str = None,
-    limit: int = 50,
-    filter_essential: bool = False,
-    filter_all: bool = False,
+    start_time: datetime,
+    end_time: datetime,
+    limit: int = None,
     errors_only: bool = False
 ):
-    """Retrieve traces for a specific strategy."""
+    """Page through a strategy's traces in a time window.
 
-    client = get_langfuse_client()
-    start_time, end_time = parse_time_range(days, start_date, end_date)
-
-    print(f"Retrieving traces for strategy: {strategy_slug}")
-    print(f"  Time range: {start_time} to {end_time}")
-    print(f"  Limit: {limit} traces")
-    if filter_essential:
-        print(f"  Size optimization: Essential fields only (~95% reduction)")
-    if filter_all:
-        print(f"  Size optimization: Maximum (~96% reduction)")
-    if errors_only:
-        print(f"  Filter: Errors only")
-
-    all_traces = []
-    all_observations = {}
+    Returns (traces, observations by trace ID). Fetches every trace in the
+    window when limit is None.
+    """
+    traces = []
+    observations = {}
     page = 1
+    by_tag = filter_by_tag(start_time)
     page_limit = min(limit, 50) if limit else 50
 
+    # Errors-only: traces are kept if they, or any of their observations, are ERROR level
+    error_trace_ids = fetch_error_trace_ids(client, start_time, end_time) if errors_only else None
+
     while True:
         # Calculate remaining traces to fetch
-        remaining = limit - len(all_traces) if limit else page_limit
+        remaining = limit - len(traces) if limit else page_limit
         fetch_size = min(remaining, page_limit) if limit else page_limit
 
         # Build query parameters
@@ -194,10 +359,9 @@ def retrieve_strategy_traces(
             'from_timestamp': start_time,
             'to_timestamp': end_time,
         }
-
-        # Filter by strategy in metadata
-        # Note: Langfuse API may not support metadata filtering server-side,
-        # so we'll filter client-side after retrieval
+        if by_tag:
+            # Filter by strategy server-side; the scope node tags every trace
+            params['tags'] = [f"strategy:{strategy_slug}"]
 
         try:
             traces_response = client.api.trace.list(**params)
@@ -205,56 +369,36 @@ def retrieve_strategy_traces(
             if not hasattr(traces_response, 'data') or not traces_response.data:
                 break
 
-            # Filter traces by strategy
-            for trace in traces_response.data:
-                trace_dict = trace.dict() if hasattr(trace, 'dict') else trace
-
-                # Check if trace belongs to this strategy
-                metadata = trace_dict.get('metadata', {})
-                trace_strategy = metadata.get('strategy_slug')
-
-                # Match by strategy slug
-                if trace_strategy != strategy_slug:
-                    continue
-
-                # Filter by errors if requested
-                if errors_only:
-                    level = trace_dict.get('level', 'DEFAULT')
-                    if level != 'ERROR':
-                        # Also check observations for errors
-                        has_error = False
-                        try:
-                            obs_response = client.api.observations.list(trace_id=trace_dict['id'])
-                            if hasattr(obs_response, 'data'):
-                                for obs in obs_response.data:
-                                    obs_dict = obs.dict() if hasattr(obs, 'dict') else obs
-                                    if obs_dict.get('level') == 'ERROR':
-                                        has_error = True
-                                        break
-                        except:
-                            pass
-                        if not has_error:
-                            continue
-
-                all_traces.append(trace_dict)
-
-                # Retrieve observations for this trace
-                try:
-                    obs_response = client.api.observations.list(trace_id=trace_dict['id'])
-                    if hasattr(obs_response, 'data'):
-                        all_observations[trace_dict['id']] = [
-                            obs.dict() if hasattr(obs, 'dict') else obs
-                            for obs in obs_response.data
-                        ]
-                except Exception as e:
-                    print(f"  Warning: Could not retrieve observations for trace {trace_dict['id']}: {e}", file=sys.stderr)
+            matched = dump_models(traces_response.data)
+
+            # Untagged windows: filter by strategy in metadata client-side
+            if not by_tag:
+                matched = [
+                    t for t in matched
+                    if (t.get('metadata') or {}).get('strategy_slug') == strategy_slug
+                ]
+
+            # Filter by errors if requested
+            if errors_only:
+                matched = [
+                    t for t in matched
+                    if t.get('level') == 'ERROR' or t['id'] in error_trace_ids
+                ]
+
+            # Retrieve observations for all matching traces in parallel
+            page_observations = fetch_observations(client, [t['id'] for t in matched])
+
+            for trace_dict in matched:
+                trace_observations = page_observations.get(trace_dict['id'])
+                traces.append(trace_dict)
+                if trace_observations is not None:
+                    observations[trace_dict['id']] = trace_observations
 
             fetched_count = len(traces_response.data)
-            print(f"  Page {page}: fetched {fetched_count} traces, {len(all_traces)} match strategy (total: {len(all_traces)})")
+            print(f"  Page {page}: fetched {fetched_count} traces, {len(traces)} match strategy (total: {len(traces)})")
 
             # Check if we've reached the limit
-            if limit and len(all_traces) >= limit:
-                print(f"  ✓ Limit of {limit} traces reached")
+            if limit and len(traces) >= limit:
                 break
 
             # Check if there are more pages
@@ -267,40 +411,272 @@ def retrieve_strategy_traces(
             print(f"Error retrieving traces: {e}", file=sys.stderr)
             raise
 
-    if not all_traces:
+    return traces, observations
+
+
+def day_buckets(start_time: datetime, end_time: datetime):
+    """Split [start_time, end_time) into calendar-day windows, newest first."""
+    bucket_end = end_time
+    while bucket_end > start_time:
+        day_start = datetime.combine(bucket_end.date(), time.min)
+        if day_start == bucket_end:
+            day_start -= timedelta(days=1)
+        bucket_start = max(day_start, start_time)
+        yield bucket_start, bucket_end
+        bucket_end = bucket_start
+
+
+def day_cache_path(strategy_slug: str, day, errors_only: bool) -> Path:
+    """Cache file for one strategy's traces on one calendar day.
+
+    The filter mode is part of the key, so days fetched by tag and by
+    metadata never share a cache file.
+    """
+    mode = "tag" if filter_by_tag(datetime.combine(day, time.min)) else "metadata"
+    key = hashlib.sha1(f"{strategy_slug}|{day.isoformat()}|{errors_only}|{mode}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json.gz"
+
+
+def load_day_cache(path: Path):
+    """Return cached (traces, observations) for a day, or None on a miss."""
+    try:
+        raw = gzip.decompress(path.read_bytes())
+    except (FileNotFoundError, OSError, EOFError):
+        return None
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data['traces'], data['observations']
+
+
+def save_day_cache(path: Path, traces: list, observations: dict):
+    """Store a completed day's traces and observations."""
+    data = {'traces': traces, 'observations': observations}
+    if orjson is not None:
+        raw = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        raw = json.dumps(data, default=str).encode()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_bytes(gzip.compress(raw))
+    tmp_path.replace(path)
+
+
+def iter_strategy_traces(
+    client,
+    strategy_slug: str,
+    start_time: datetime,
+    end_time: datetime,
+    limit: int = 50,
+    errors_only: bool = False,
+    filter_essential: bool = False,
+    use_cache: bool = True,
+    rebuild_cache: bool = False
+):
+    """Yield (trace, observations) for a strategy, one day bucket at a time.
+
+    Whole past days are served from the on-disk day cache when present;
+    today and partial days are always fetched from Langfuse. Only one day's
+    traces are held in memory. observations is None when they could not be
+    fetched.
+    """
+    count = 0
+    today_start = datetime.combine(date.today(), time.min)
+
+    for bucket_start, bucket_end in day_buckets(start_time, end_time):
+        remaining = limit - count if limit else None
+
+        # Past traces are immutable, so complete past days can be cached
+        cacheable = (
+            use_cache
+            and bucket_end <= today_start
+            and bucket_end - bucket_start == timedelta(days=1)
+        )
+
+        if cacheable:
+            cache_path = day_cache_path(strategy_slug, bucket_start.date(), errors_only)
+            cached = None if rebuild_cache else load_day_cache(cache_path)
+            if cached is not None:
+                traces, observations = cached
+                print(f"  {bucket_start.date()}: {len(traces)} traces from cache")
+            else:
+                traces, observations = fetch_traces(
+                    client, strategy_slug, bucket_start, bucket_end, errors_only=errors_only
+                )
+                save_day_cache(cache_path, traces, observations)
+            if remaining:
+                traces = traces[:remaining]
+        else:
+            traces, observations = fetch_traces(
+                client, strategy_slug, bucket_start, bucket_end,
+                limit=remaining, errors_only=errors_only
+            )
+
+        for trace in traces:
+            trace_observations = observations.get(trace['id'])
+            if filter_essential:
+                trace = clean_trace(trace)
+                if trace_observations is not None:
+                    trace_observations = [clean_observation(o) for o in trace_observations]
+            count += 1
+            yield trace, trace_observations
+
+        # Check if we've reached the limit
+        if limit and count >= limit:
+            print(f"  ✓ Limit of {limit} traces reached")
+            break
+
+
+def _start_retrieval(strategy_slug, days, start_date, end_date, limit,
+                     filter_essential, filter_all, errors_only):
+    """Resolve the time range, print the query summary and return query_params."""
+    start_time, end_time = parse_time_range(days, start_date, end_date)
+
+    print(f"Retrieving traces for strategy: {strategy_slug}")
+    print(f"  Time range: {start_time} to {end_time}")
+    print(f"  Limit: {limit} traces")
+    if filter_essential:
+        print(f"  Size optimization: Essential fields only (~95% reduction)")
+    if filter_all:
+        print(f"  Size optimization: Maximum (~96% reduction)")
+    if errors_only:
+        print(f"  Filter: Errors only")
+
+    return start_time, end_time, {
+        'strategy_slug': strategy_slug,
+        'start_time': start_time.isoformat(),
+        'end_time': end_time.isoformat(),
+        'limit': limit,
+        'filter_essential': filter_essential,
+        'filter_all': filter_all,
+        'errors_only': errors_only,
+    }
+
+
+def _finish_retrieval(strategy_slug, trace_count, observation_count, filtered):
+    """Print the retrieval summary and hints when nothing was found."""
+    if not trace_count:
         print(f"\n⚠️  No traces found for strategy '{strategy_slug}'", file=sys.stderr)
         print(f"Verify that:", file=sys.stderr)
         print(f"  1. Strategy slug is correct", file=sys.stderr)
         print(f"  2. Strategy has been executed (traces exist)", file=sys.stderr)
-        print(f"  3. Traces have metadata.strategy_slug field", file=sys.stderr)
+        print(f"  3. Traces have metadata.strategy_slug (or, after STRATEGY_TAG_SINCE, the strategy:{strategy_slug} tag)", file=sys.stderr)
         print(f"  4. Time range covers execution period", file=sys.stderr)
 
-    print(f"\n✓ Retrieved {len(all_traces)} traces for strategy '{strategy_slug}'")
-    print(f"✓ Retrieved observations for {len(all_observations)} traces")
-
-    # Build bundle
-    bundle = {
-        'query_params': {
-            'strategy_slug': strategy_slug,
-            'start_time': start_time.isoformat(),
-            'end_time': end_time.isoformat(),
-            'limit': limit,
-            'filter_essential': filter_essential,
-            'filter_all': filter_all,
-            'errors_only': errors_only,
-        },
+    print(f"\n✓ Retrieved {trace_count} traces for strategy '{strategy_slug}'")
+    print(f"✓ Retrieved observations for {observation_count} traces")
+    if filtered:
+        print(f"✓ Applied size optimization")
+
+
+def retrieve_strategy_traces(
+    strategy_slug: str,
+    days: int = 7,
+    start_date: str = None,
+    end_date: str = None,
+    limit: int = 50,
+    filter_essential: bool = False,
+    filter_all: bool = False,
+    errors_only: bool = False,
+    use_cache: bool = True,
+    rebuild_cache: bool = False
+):
+    """Retrieve traces for a specific strategy as an in-memory bundle.
+
+    Use stream_strategy_traces to write large retrievals straight to disk.
+    """
+    start_time, end_time, query_params = _start_retrieval(
+        strategy_slug, days, start_date, end_date, limit, filter_essential, filter_all, errors_only
+    )
+
+    all_traces = []
+    all_observations = {}
+    for trace, observations in iter_strategy_traces(
+        _client(), strategy_slug, start_time, end_time, limit=limit, errors_only=errors_only,
+        filter_essential=filter_essential or filter_all,
+        use_cache=use_cache, rebuild_cache=rebuild_cache
+    ):
+        all_traces.append(trace)
+        if observations is not None:
+            all_observations[trace['id']] = observations
+
+    _finish_retrieval(strategy_slug, len(all_traces), len(all_observations), filter_essential or filter_all)
+
+    return {
+        'query_params': query_params,
         'traces': all_traces,
         'observations': all_observations,
         'trace_count': len(all_traces),
         'trace_ids': [t['id'] for t in all_traces]
     }
 
-    # Apply size optimization if requested
-    if filter_essential or filter_all:
-        bundle = filter_essential_fields(bundle)
-        print(f"✓ Applied size optimization")
 
-    return bundle
+def stream_strategy_traces(
+    output_path: Path,
+    strategy_slug: str,
+    days: int = 7,
+    start_date: str = None,
+    end_date: str = None,
+    limit: int = 50,
+    filter_essential: bool = False,
+    filter_all: bool = False,
+    errors_only: bool = False,
+    use_cache: bool = True,
+    rebuild_cache: bool = False
+) -> dict:
+    """Retrieve traces for a strategy and write the bundle to output_path as they arrive.
+
+    Produces the same JSON document as retrieve_strategy_traces, but traces
+    are written one at a time and observations are spooled to a temporary
+    file, so memory stays bounded by a single day bucket. Returns the
+    trace_count, trace_ids and observation_count.
+    """
+    start_time, end_time, query_params = _start_retrieval(
+        strategy_slug, days, start_date, end_date, limit, filter_essential, filter_all, errors_only
+    )
+
+    trace_ids = []
+    observation_count = 0
+    with open(output_path, 'wb') as out, tempfile.TemporaryFile() as obs_spool:
+        out.write(b'{\n"query_params": ' + _dumps(query_params) + b',\n"traces": [\n')
+
+        for trace, observations in iter_strategy_traces(
+            _client(), strategy_slug, start_time, end_time, limit=limit, errors_only=errors_only,
+            filter_essential=filter_essential or filter_all,
+            use_cache=use_cache, rebuild_cache=rebuild_cache
+        ):
+            if trace_ids:
+                out.write(b',\n')
+            out.write(_dumps(trace))
+            trace_ids.append(trace['id'])
+
+            if observations is not None:
+                if observation_count:
+                    obs_spool.write(b',\n')
+                obs_spool.write(_dumps(str(trace['id'])) + b': ' + _dumps(observations))
+                observation_count += 1
+
+        out.write(b'\n],\n"observations": {\n')
+        obs_spool.seek(0)
+        shutil.copyfileobj(obs_spool, out)
+        out.write(b'\n},\n"trace_count": ' + str(len(trace_ids)).encode()
+                  + b',\n"trace_ids": ' + _dumps(trace_ids) + b'\n}\n')
+
+    _finish_retrieval(strategy_slug, len(trace_ids), observation_count, filter_essential or filter_all)
+
+    return {
+        'trace_count': len(trace_ids),
+        'trace_ids': trace_ids,
+        'observation_count': observation_count
+    }
+
+
+def _dumps(data) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when installed.
+
+    orjson emits datetimes as ISO 8601; anything else unknown falls back to str.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=str).encode()
 
 
 def main():
@@ -317,6 +693,9 @@ Examples:
 
   # Errors only with size optimization
   %(prog)s --strategy "company/dossier" --errors-only --filter-essential
+
+  # Bypass the day cache
+  %(prog)s --strategy "daily_news_briefing" --no-cache
         """
     )
 
@@ -340,6 +719,13 @@ Examples:
     size_group.add_argument('--filter-all', action='store_true',
                            help='Maximum compression (96%% reduction)')
 
+    # Day cache
+    cache_group = parser.add_argument_group('Day Cache')
+    cache_group.add_argument('--no-cache', action='store_true',
+                            help='Fetch every day from Langfuse and leave the day cache untouched')
+    cache_group.add_argument('--rebuild', action='store_true',
+                            help='Refetch cached past days and overwrite their cache files')
+
     # Output
     parser.add_argument('--output', default='/tmp/strategy_analysis/strategy_traces.json',
                        help='Output file path')
@@ -350,7 +736,11 @@ Examples:
     days_param = None if (args.start_date or args.end_date) else args.days
 
     try:
-        bundle = retrieve_strategy_traces(
+        # Stream straight to the output file
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        summary = stream_strategy_traces(
+            output_path,
             strategy_slug=args.strategy,
             days=days_param,
             start_date=args.start_date,
@@ -358,22 +748,18 @@ Examples:
             limit=args.limit,
             filter_essential=args.filter_essential,
             filter_all=args.filter_all,
-            errors_only=args.errors_only
+            errors_only=args.errors_only,
+            use_cache=not args.no_cache,
+            rebuild_cache=args.rebuild
         )
 
-        # Save output
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(bundle, f, indent=2, default=str)
-
         print(f"\n✓ Output saved to: {output_path}")
-        print(f"✓ {bundle['trace_count']} traces, {len(bundle['observations'])} with observations")
+        print(f"✓ {summary['trace_count']} traces, {summary['observation_count']} with observations")
 
         # Print summary
-        if bundle['traces']:
+        if summary['trace_ids']:
             print(f"\nSample trace IDs:")
-            for trace_id in bundle['trace_ids'][:5]:
+            for trace_id in summary['trace_ids'][:5]:
                 print(f"  - {trace_id}")
 
     except Exception as e:
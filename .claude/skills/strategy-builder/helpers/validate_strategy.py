@@ -12,33 +12,129 @@ python3 validate_strategy.py --strategy /tmp/new_strategy.yaml
 # Strict mode (fail on warnings)
 python3 validate_strategy.py --strategy /tmp/strategy.yaml --strict
 
+# Stop at the first problem
+python3 validate_strategy.py --strategy /tmp/strategy.yaml --strict --fail-fast
+
 # Save validation report
 python3 validate_strategy.py --strategy /tmp/strategy.yaml --output /tmp/validation.json
 """
 
 import argparse
+import hashlib
+import importlib.util
 import json
 import re
 import sys
 import yaml
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Set, Tuple
 
 # Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
 sys.path.insert(0, str(PROJECT_ROOT))
 
 try:
-    from jsonschema import validate, ValidationError
+    import fastjsonschema
+except ImportError:  # fastjsonschema is optional; jsonschema is used instead
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used instead
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as StrategyLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as StrategyLoader
+
+try:
+    from jsonschema import ValidationError
     SCHEMA_PATH = PROJECT_ROOT / "strategies" / "schema.json"
     if SCHEMA_PATH.exists():
-        with open(SCHEMA_PATH) as f:
-            STRATEGY_SCHEMA = json.load(f)
+        schema_bytes = SCHEMA_PATH.read_bytes()
+        STRATEGY_SCHEMA = json.loads(schema_bytes)
+        SCHEMA_SHA256 = hashlib.sha256(schema_bytes).hexdigest()
     else:
         STRATEGY_SCHEMA = None
+        SCHEMA_SHA256 = None
 except Exception as e:
     print(f"Warning: Could not load strategy schema: {e}", file=sys.stderr)
     STRATEGY_SCHEMA = None
+    SCHEMA_SHA256 = None
+
+# {{var}} interpolation, and single-brace {var} (a common mistake)
+VAR_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+MALFORMED_VAR_PATTERN = re.compile(r'\{(?!\{)(\w+)\}(?!\})')
+
+# Dict keys whose domain lists are size-checked by validate_domains
+DOMAIN_FILTER_KEYS = frozenset(('search_domain_filter', 'include_domains'))
+
+# Node types walk_strategy inspects; other leaves (numbers, bools, None) are skipped
+WALKED_TYPES = (str, dict, list)
+
+# Variables filled in by the runtime; anything else is reported as uncommon
+EXPECTED_VARS = frozenset(('topic', 'start_date', 'end_date', 'current_date', 'search_recency_filter'))
+
+# Pregenerated fastjsonschema validator, written by --compile-schema
+GENERATED_VALIDATOR_PATH = Path(__file__).with_name("_schema_validator.py")
+
+
+def compile_schema(schema: Dict[str, Any]):
+    """Compile a JSON schema into a reusable validator callable.
+
+    Uses fastjsonschema's generated code when installed, otherwise a
+    jsonschema validator instance; either way the schema is processed once.
+    """
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+
+    from jsonschema.validators import validator_for
+    return validator_for(schema)(schema).validate
+
+
+def write_generated_validator(path: Path = GENERATED_VALIDATOR_PATH) -> Path:
+    """Generate the fastjsonschema validator module for the current schema."""
+    if fastjsonschema is None:
+        raise RuntimeError("fastjsonschema is required to generate the schema validator")
+    if not STRATEGY_SCHEMA:
+        raise RuntimeError(f"Schema file not found: {SCHEMA_PATH}")
+
+    code = fastjsonschema.compile_to_code(STRATEGY_SCHEMA)
+    path.write_text(
+        "# Generated by validate_strategy.py --compile-schema from strategies/schema.json.\n"
+        "# Do not edit; regenerate after changing the schema.\n"
+        f'SCHEMA_SHA256 = "{SCHEMA_SHA256}"\n'
+        + code
+    )
+    return path
+
+
+def load_schema_validator():
+    """Return the strategy schema validator.
+
+    Imports the pregenerated module when it matches the current schema hash,
+    skipping compilation entirely; otherwise compiles at runtime.
+    """
+    if not STRATEGY_SCHEMA:
+        return None
+
+    if fastjsonschema is not None and GENERATED_VALIDATOR_PATH.exists():
+        try:
+            spec = importlib.util.spec_from_file_location("_schema_validator", GENERATED_VALIDATOR_PATH)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            if module.SCHEMA_SHA256 == SCHEMA_SHA256:
+                return module.validate
+        except Exception as e:
+            print(f"Warning: Ignoring generated schema validator: {e}", file=sys.stderr)
+
+    return compile_schema(STRATEGY_SCHEMA)
+
+
+# Loaded once at import so each validate_schema call only runs the checks
+SCHEMA_VALIDATOR = load_schema_validator()
 
 
 def load_strategy_yaml(file_path: str) -> Tuple[Dict[str, Any], List[str]]:
@@ -48,7 +144,7 @@ def load_strategy_yaml(file_path: str) -> Tuple[Dict[str, Any], List[str]]:
     try:
         with open(file_path, 'r') as f:
             content = f.read()
-            strategy = yaml.safe_load(content)
+            strategy = yaml.load(content, Loader=StrategyLoader)
 
         if not isinstance(strategy, dict):
             errors.append("Strategy file must contain a YAML dictionary")
@@ -68,16 +164,24 @@ def validate_schema(strategy: Dict[str, Any]) -> List[str]:
     """Validate against JSON schema."""
     errors = []
 
-    if not STRATEGY_SCHEMA:
+    if not SCHEMA_VALIDATOR:
         errors.append("Schema file not found - skipping schema validation")
         return errors
 
     try:
-        validate(instance=strategy, schema=STRATEGY_SCHEMA)
+        SCHEMA_VALIDATOR(strategy)
     except ValidationError as e:
         errors.append(f"Schema validation failed: {e.message}")
         if e.path:
             errors.append(f"  Path: {' > '.join(str(p) for p in e.path)}")
+    except Exception as e:
+        if fastjsonschema is None or not isinstance(e, fastjsonschema.JsonSchemaException):
+            raise
+        errors.append(f"Schema validation failed: {e.message}")
+        # fastjsonschema paths start with the root name "data"
+        path = (e.path or [])[1:]
+        if path:
+            errors.append(f"  Path: {' > '.join(str(p) for p in path)}")
 
     return errors
 
@@ -128,45 +232,95 @@ def validate_tool_chain(tool_chain: List[Dict]) -> Tuple[List[str], List[str]]:
     return errors, warnings
 
 
-def validate_variable_interpolation(strategy: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+@dataclass
+class StrategyFindings:
+    """Everything collected by a single walk over a strategy.
+
+    With stop_on_error (or stop_on_warning) set, the walk ends at the first
+    malformed variable (or any warning-level finding) instead of collecting
+    them all.
+    """
+    used_vars: Set[str] = field(default_factory=set)
+    malformed: Set[str] = field(default_factory=set)
+    domain_warnings: List[str] = field(default_factory=list)
+    stop_on_error: bool = False
+    stop_on_warning: bool = False
+
+    def should_stop(self) -> bool:
+        if self.stop_on_error and self.malformed:
+            return True
+        return self.stop_on_warning and bool(
+            self.domain_warnings or not self.used_vars <= EXPECTED_VARS
+        )
+
+
+class _StopWalk(Exception):
+    """Raised inside walk_strategy to abandon the traversal early."""
+
+
+def walk_strategy(obj, findings: StrategyFindings = None, path="") -> StrategyFindings:
+    """Recursively collect variables, malformed interpolation and domain warnings.
+
+    One traversal feeds both validate_variable_interpolation and
+    validate_domains.
+    """
+    if findings is None:
+        findings = StrategyFindings()
+
+    if isinstance(obj, str):
+        findings.used_vars.update(VAR_PATTERN.findall(obj))
+        findings.malformed.update(MALFORMED_VAR_PATTERN.findall(obj))
+        if findings.stop_on_error and findings.should_stop():
+            raise _StopWalk
+    elif isinstance(obj, dict):
+        # Check for domain filter fields (one set test for dicts that have neither)
+        if not DOMAIN_FILTER_KEYS.isdisjoint(obj):
+            if 'search_domain_filter' in obj:
+                domains = obj['search_domain_filter']
+                if isinstance(domains, list) and len(domains) > 20:
+                    findings.domain_warnings.append(f"{path}: search_domain_filter has {len(domains)} domains (max 20 for Sonar)")
+
+            if 'include_domains' in obj:
+                domains = obj['include_domains']
+                if isinstance(domains, list) and len(domains) > 10:
+                    findings.domain_warnings.append(f"{path}: include_domains has {len(domains)} domains (recommend max 10)")
+
+        for key, value in obj.items():
+            if isinstance(key, str):
+                findings.malformed.update(MALFORMED_VAR_PATTERN.findall(key))
+            if findings.stop_on_error and findings.should_stop():
+                raise _StopWalk
+            if isinstance(value, WALKED_TYPES):
+                walk_strategy(value, findings, f"{path}.{key}" if path else key)
+    elif isinstance(obj, list):
+        for idx, item in enumerate(obj):
+            if isinstance(item, WALKED_TYPES):
+                walk_strategy(item, findings, f"{path}[{idx}]")
+
+    return findings
+
+
+def validate_variable_interpolation(
+    strategy: Dict[str, Any],
+    findings: StrategyFindings = None
+) -> Tuple[List[str], List[str]]:
     """Check variable interpolation syntax."""
     errors = []
     warnings = []
 
-    # Common variable patterns
-    var_pattern = re.compile(r'\{\{(\w+)\}\}')
-
-    # Extract all used variables
-    used_vars = set()
-
-    def extract_vars(obj, path=""):
-        """Recursively extract variable names."""
-        if isinstance(obj, str):
-            matches = var_pattern.findall(obj)
-            for match in matches:
-                used_vars.add(match)
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                extract_vars(value, f"{path}.{key}" if path else key)
-        elif isinstance(obj, list):
-            for idx, item in enumerate(obj):
-                extract_vars(item, f"{path}[{idx}]")
-
-    extract_vars(strategy)
+    if findings is None:
+        findings = walk_strategy(strategy)
 
     # Check for common variables
-    expected_vars = {'topic', 'start_date', 'end_date', 'current_date', 'search_recency_filter'}
-    unexpected_vars = used_vars - expected_vars
+    unexpected_vars = findings.used_vars - EXPECTED_VARS
 
     if unexpected_vars:
         warnings.append(f"Uncommon variables used: {', '.join(unexpected_vars)}")
         warnings.append("  Ensure these are defined in strategy index or filled at runtime")
 
     # Check for malformed interpolation
-    strategy_str = json.dumps(strategy)
-    malformed = re.findall(r'\{(?!\{)(\w+)\}(?!\})', strategy_str)
-    if malformed:
-        errors.append(f"Malformed variable interpolation (use {{{{var}}}} not {{var}}): {', '.join(set(malformed))}")
+    if findings.malformed:
+        errors.append(f"Malformed variable interpolation (use {{{{var}}}} not {{var}}): {', '.join(findings.malformed)}")
 
     return errors, warnings
 
@@ -192,52 +346,18 @@ def validate_limits(strategy: Dict[str, Any]) -> List[str]:
     return warnings
 
 
-def validate_domains(strategy: Dict[str, Any]) -> List[str]:
+def validate_domains(strategy: Dict[str, Any], findings: StrategyFindings = None) -> List[str]:
     """Check domain filter configuration."""
-    warnings = []
+    if findings is None:
+        findings = walk_strategy(strategy)
+    return list(findings.domain_warnings)
 
-    def check_domains(obj, path=""):
-        """Recursively check domain filters."""
-        if isinstance(obj, dict):
-            # Check for domain filter fields
-            if 'search_domain_filter' in obj:
-                domains = obj['search_domain_filter']
-                if isinstance(domains, list) and len(domains) > 20:
-                    warnings.append(f"{path}: search_domain_filter has {len(domains)} domains (max 20 for Sonar)")
 
-            if 'include_domains' in obj:
-                domains = obj['include_domains']
-                if isinstance(domains, list) and len(domains) > 10:
-                    warnings.append(f"{path}: include_domains has {len(domains)} domains (recommend max 10)")
+def _run_checks(strategy: Dict[str, Any], result: Dict[str, Any], strict: bool, fail_fast: bool) -> None:
+    """Run the per-strategy checks, appending findings to result in place."""
 
-            for key, value in obj.items():
-                check_domains(value, f"{path}.{key}" if path else key)
-
-        elif isinstance(obj, list):
-            for idx, item in enumerate(obj):
-                check_domains(item, f"{path}[{idx}]")
-
-    check_domains(strategy)
-    return warnings
-
-
-def run_validation(file_path: str, strict: bool = False) -> Dict[str, Any]:
-    """Run all validation checks."""
-
-    result = {
-        'file_path': file_path,
-        'valid': True,
-        'errors': [],
-        'warnings': []
-    }
-
-    # Load YAML
-    strategy, load_errors = load_strategy_yaml(file_path)
-    result['errors'].extend(load_errors)
-
-    if load_errors:
-        result['valid'] = False
-        return result
+    def halted() -> bool:
+        return fail_fast and bool(result['errors'] or (strict and result['warnings']))
 
     # Schema validation
     schema_errors = validate_schema(strategy)
@@ -246,26 +366,67 @@ def run_validation(file_path: str, strict: bool = False) -> Dict[str, Any]:
     # Required fields
     field_errors = validate_required_fields(strategy)
     result['errors'].extend(field_errors)
+    if halted():
+        return
 
     # Tool chain
     if 'tool_chain' in strategy:
         tc_errors, tc_warnings = validate_tool_chain(strategy['tool_chain'])
         result['errors'].extend(tc_errors)
         result['warnings'].extend(tc_warnings)
+        if halted():
+            return
+
+    # Variables and domain filters share one walk over the strategy
+    findings = StrategyFindings(stop_on_error=fail_fast, stop_on_warning=fail_fast and strict)
+    try:
+        walk_strategy(strategy, findings)
+    except _StopWalk:
+        pass
 
     # Variable interpolation
-    var_errors, var_warnings = validate_variable_interpolation(strategy)
+    var_errors, var_warnings = validate_variable_interpolation(strategy, findings)
     result['errors'].extend(var_errors)
     result['warnings'].extend(var_warnings)
+    if halted():
+        return
 
     # Limits
     limit_warnings = validate_limits(strategy)
     result['warnings'].extend(limit_warnings)
+    if halted():
+        return
 
     # Domains
-    domain_warnings = validate_domains(strategy)
+    domain_warnings = validate_domains(strategy, findings)
     result['warnings'].extend(domain_warnings)
 
+
+def run_validation(file_path: str, strict: bool = False, fail_fast: bool = False) -> Dict[str, Any]:
+    """Run all validation checks.
+
+    With fail_fast, checks stop at the first stage that reports an error
+    (or, in strict mode, a warning), and the variable/domain walk stops at
+    its first such finding.
+    """
+
+    result = {
+        'file_path': file_path,
+        'valid': True,
+        'errors': [],
+        'warnings': []
+    }
+
+    # Load YAML
+    strategy, load_errors = load_strategy_yaml(file_path)
+    result['errors'].extend(load_errors)
+
+    if load_errors:
+        result['valid'] = False
+        return result
+
+    _run_checks(strategy, result, strict, fail_fast)
+
     # Determine validity
     if result['errors']:
         result['valid'] = False
@@ -286,6 +447,13 @@ def run_validation(file_path: str, strict: bool = False) -> Dict[str, Any]:
     return result
 
 
+def _dumps(data) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Validate strategy YAML file',
@@ -298,26 +466,47 @@ Examples:
   # Strict mode (warnings = errors)
   %(prog)s --strategy /tmp/strategy.yaml --strict
 
+  # Stop at the first problem instead of reporting all of them
+  %(prog)s --strategy /tmp/strategy.yaml --strict --fail-fast
+
   # Save report
   %(prog)s --strategy /tmp/strategy.yaml --output /tmp/validation.json
+
+  # Regenerate the precompiled schema validator after editing schema.json
+  %(prog)s --compile-schema
         """
     )
 
-    parser.add_argument('--strategy', required=True, help='Path to strategy YAML file')
+    parser.add_argument('--strategy', help='Path to strategy YAML file')
     parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+    parser.add_argument('--fail-fast', action='store_true',
+                       help='Stop at the first error (or warning with --strict)')
     parser.add_argument('--output', help='Output file for validation report (JSON)')
+    parser.add_argument('--compile-schema', action='store_true',
+                       help=f'Write the precompiled schema validator to {GENERATED_VALIDATOR_PATH.name} and exit')
 
     args = parser.parse_args()
 
+    if args.compile_schema:
+        try:
+            path = write_generated_validator()
+        except Exception as e:
+            print(f"\n✗ Could not generate schema validator: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"✓ Schema validator written to: {path}")
+        return
+
+    if not args.strategy:
+        parser.error("--strategy is required")
+
     try:
-        result = run_validation(args.strategy, args.strict)
+        result = run_validation(args.strategy, args.strict, args.fail_fast)
 
         # Save output if requested
         if args.output:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(result, f, indent=2)
+            output_path.write_bytes(_dumps(result))
             print(f"Validation report saved to: {output_path}\n")
 
         # Print summary
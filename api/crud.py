@@ -1,15 +1,84 @@
 """Database CRUD operations."""
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from api.models import ResearchTask, ScopeClassification, Strategy, GlobalSetting
-from datetime import datetime
 from uuid import UUID
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, Tuple
+from collections import OrderedDict
+import copy
 import logging
 import hashlib
+import time
 
 logger = logging.getLogger(__name__)
 
+# In-process LRU of scope classifications keyed by request hash.
+# Classifications never expire, so entries only leave on eviction.
+SCOPE_CACHE_SIZE = 4096
+_SCOPE_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Rows fetched per round-trip by the stream_* variants
+STREAM_BATCH_SIZE = 100
+
+# Short-lived caches for rarely-changing strategy and setting rows, keyed by
+# slug/key and invalidated on write. The TTL bounds staleness across workers.
+# Entries are column snapshots, never live ORM instances, so no session leaks
+# between requests; the oldest entry is evicted beyond LOOKUP_CACHE_SIZE.
+LOOKUP_CACHE_TTL = 60
+LOOKUP_CACHE_SIZE = 256
+_STRATEGY_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_SETTING_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _cache_get(cache: Dict[str, Tuple[float, Dict[str, Any]]], key: str, model) -> Any:
+    """Return a fresh detached model built from a cached snapshot.
+
+    Returns None if the key is missing or past its TTL. Each hit gets its own
+    instance and its own copy of JSON columns, so callers cannot alter the
+    cached row.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires_at, snapshot = entry
+    if expires_at < time.monotonic():
+        cache.pop(key, None)
+        return None
+    return model(**copy.deepcopy(snapshot))
+
+
+def _cache_put(cache: Dict[str, Tuple[float, Dict[str, Any]]], key: str, row: Any) -> None:
+    """Cache a snapshot of a non-None row for LOOKUP_CACHE_TTL seconds."""
+    if row is None:
+        return
+    cache.pop(key, None)
+    if len(cache) >= LOOKUP_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    snapshot = {
+        column.key: copy.deepcopy(getattr(row, column.key))
+        for column in row.__table__.columns
+    }
+    cache[key] = (time.monotonic() + LOOKUP_CACHE_TTL, snapshot)
+
+
+def _utc_now():
+    """Current UTC time as a naive timestamp, computed by the database.
+
+    The DateTime columns are naive and defaulted with datetime.utcnow, so
+    now() is converted to UTC regardless of the server's timezone.
+    """
+    return func.timezone('UTC', func.now())
+
+
+async def _stream_scalars(db: AsyncSession, query) -> AsyncIterator[Any]:
+    """Yield ORM objects from a server-side cursor in STREAM_BATCH_SIZE batches."""
+    result = await db.stream_scalars(
+        query.execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    async for row in result:
+        yield row
+
 
 async def create_task(
     db: AsyncSession,
@@ -31,6 +100,14 @@ async def create_task(
     return task
 
 
+async def get_task(db: AsyncSession, task_id: UUID) -> ResearchTask | None:
+    """Get a task by ID."""
+    result = await db.execute(
+        select(ResearchTask).where(ResearchTask.id == task_id)
+    )
+    return result.scalar_one_or_none()
+
+
 async def get_tasks_by_email(db: AsyncSession, email: str) -> list[ResearchTask]:
     """Get all tasks for an email."""
     result = await db.execute(
@@ -39,6 +116,13 @@ async def get_tasks_by_email(db: AsyncSession, email: str) -> list[ResearchTask]
     return result.scalars().all()
 
 
+def stream_tasks_by_email(db: AsyncSession, email: str) -> AsyncIterator[ResearchTask]:
+    """Stream all tasks for an email without materializing the full result."""
+    return _stream_scalars(
+        db, select(ResearchTask).where(ResearchTask.email == email)
+    )
+
+
 async def get_tasks_by_frequency(
     db: AsyncSession,
     frequency: str
@@ -57,19 +141,20 @@ async def update_task(
     task_id: UUID,
     **updates
 ) -> ResearchTask | None:
-    """Update task fields."""
+    """Update task fields in a single UPDATE ... RETURNING round-trip."""
+    values = {key: value for key, value in updates.items() if value is not None}
+
+    if not values:
+        return await get_task(db, task_id)
+
     result = await db.execute(
-        select(ResearchTask).where(ResearchTask.id == task_id)
+        update(ResearchTask)
+        .where(ResearchTask.id == task_id)
+        .values(**values)
+        .returning(ResearchTask)
     )
     task = result.scalar_one_or_none()
-
-    if task:
-        for key, value in updates.items():
-            if value is not None:
-                setattr(task, key, value)
-        await db.commit()
-        await db.refresh(task)
-
+    await db.commit()
     return task
 
 
@@ -78,7 +163,7 @@ async def mark_task_executed(db: AsyncSession, task_id: UUID):
     await db.execute(
         update(ResearchTask)
         .where(ResearchTask.id == task_id)
-        .values(last_run_at=datetime.utcnow())
+        .values(last_run_at=_utc_now())
     )
     await db.commit()
 
@@ -86,15 +171,23 @@ async def mark_task_executed(db: AsyncSession, task_id: UUID):
 async def delete_task(db: AsyncSession, task_id: UUID) -> bool:
     """Delete a task."""
     result = await db.execute(
-        select(ResearchTask).where(ResearchTask.id == task_id)
+        delete(ResearchTask).where(ResearchTask.id == task_id)
     )
-    task = result.scalar_one_or_none()
+    await db.commit()
+    return result.rowcount > 0
 
-    if task:
-        await db.delete(task)
-        await db.commit()
-        return True
-    return False
+
+def _request_hash(request_text: str) -> str:
+    """SHA-256 hex digest of the lowercased request text."""
+    return hashlib.sha256(request_text.lower().encode()).hexdigest()
+
+
+def _remember_scope(request_hash: str, classification: Dict[str, Any]) -> None:
+    """Store a classification in the in-process LRU, evicting the oldest."""
+    _SCOPE_CACHE[request_hash] = classification
+    _SCOPE_CACHE.move_to_end(request_hash)
+    if len(_SCOPE_CACHE) > SCOPE_CACHE_SIZE:
+        _SCOPE_CACHE.popitem(last=False)
 
 
 async def get_cached_scope_classification(
@@ -103,18 +196,26 @@ async def get_cached_scope_classification(
 ) -> Optional[Dict[str, Any]]:
     """Retrieve cached classification for a research topic.
 
-    Uses case-insensitive matching to find existing classifications.
-    No expiration logic - classifications are permanent.
+    Matches case-insensitively via the indexed request_hash column and
+    memoizes hits in-process. No expiration logic - classifications are
+    permanent.
     """
+    request_hash = _request_hash(request_text)
+
+    cached = _SCOPE_CACHE.get(request_hash)
+    if cached is not None:
+        _SCOPE_CACHE.move_to_end(request_hash)
+        return dict(cached)
+
     result = await db.execute(
         select(ScopeClassification).where(
-            func.lower(ScopeClassification.request_text) == func.lower(request_text)
+            ScopeClassification.request_hash == request_hash
         ).limit(1)
     )
     entry = result.scalar_one_or_none()
 
     if entry:
-        return {
+        classification = {
             "category": entry.category,
             "time_window": entry.time_window,
             "depth": entry.depth,
@@ -122,10 +223,34 @@ async def get_cached_scope_classification(
             "tasks": entry.tasks,
             "variables": entry.variables,
         }
+        _remember_scope(request_hash, classification)
+        return dict(classification)
 
     return None
 
 
+def _scope_classification_values(
+    request_text: str,
+    result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Column values for a ScopeClassification row."""
+    return {
+        # SHA-256 hash of lowercased request text for uniqueness
+        "request_hash": _request_hash(request_text),
+        "request_text": request_text,
+        "category": result["category"],
+        "time_window": result["time_window"],
+        "depth": result["depth"],
+        "strategy_slug": result.get("strategy_slug"),
+        "tasks": result.get("tasks", []),
+        "variables": result.get("variables", {}),
+        "strategy_index_version": "v1",  # Placeholder
+        "prompt_version": "v1",  # Placeholder
+        "model_version": "gpt-4",  # Placeholder
+        "expires_at": None,  # No expiration
+    }
+
+
 async def save_scope_classification(
     db: AsyncSession,
     request_text: str,
@@ -137,22 +262,8 @@ async def save_scope_classification(
     No expiration - classifications are stored permanently.
     """
     try:
-        # Generate SHA-256 hash of lowercased request text for uniqueness
-        request_hash = hashlib.sha256(request_text.lower().encode()).hexdigest()
-
         entry = ScopeClassification(
-            request_hash=request_hash,
-            request_text=request_text,
-            category=result["category"],
-            time_window=result["time_window"],
-            depth=result["depth"],
-            strategy_slug=result.get("strategy_slug"),
-            tasks=result.get("tasks", []),
-            variables=result.get("variables", {}),
-            strategy_index_version="v1",  # Placeholder
-            prompt_version="v1",  # Placeholder
-            model_version="gpt-4",  # Placeholder
-            expires_at=None  # No expiration
+            **_scope_classification_values(request_text, result)
         )
         db.add(entry)
         await db.commit()
@@ -161,16 +272,55 @@ async def save_scope_classification(
         logger.warning(f"Failed to cache classification: {e}")
 
 
+async def save_scope_classifications_bulk(
+    db: AsyncSession,
+    entries: Iterable[Tuple[str, Dict[str, Any]]]
+) -> int:
+    """Store many (request_text, result) classifications in one INSERT.
+
+    Requests that differ only in case share a request_hash, so only the
+    first of them is sent. Rows whose request_hash already exists are
+    skipped via ON CONFLICT DO NOTHING, so the whole batch costs a single
+    commit.
+
+    Returns:
+        Number of rows actually inserted
+    """
+    rows = {}
+    for request_text, result in entries:
+        values = _scope_classification_values(request_text, result)
+        rows.setdefault(values["request_hash"], values)
+    if not rows:
+        return 0
+
+    result = await db.execute(
+        pg_insert(ScopeClassification)
+        .values(list(rows.values()))
+        .on_conflict_do_nothing(index_elements=["request_hash"])
+    )
+    await db.commit()
+    return result.rowcount
+
+
 # ============================================================================
 # STRATEGY CRUD OPERATIONS
 # ============================================================================
 
 async def get_strategy(db: AsyncSession, slug: str) -> Optional[Strategy]:
-    """Get strategy by slug."""
+    """Get strategy by slug, served from a short-TTL cache when fresh.
+
+    Cache hits return a detached Strategy that is not bound to ``db``.
+    """
+    strategy = _cache_get(_STRATEGY_CACHE, slug, Strategy)
+    if strategy is not None:
+        return strategy
+
     result = await db.execute(
         select(Strategy).where(Strategy.slug == slug)
     )
-    return result.scalar_one_or_none()
+    strategy = result.scalar_one_or_none()
+    _cache_put(_STRATEGY_CACHE, slug, strategy)
+    return strategy
 
 
 async def list_strategies(
@@ -185,6 +335,17 @@ async def list_strategies(
     return result.scalars().all()
 
 
+def stream_strategies(
+    db: AsyncSession,
+    active_only: bool = True
+) -> AsyncIterator[Strategy]:
+    """Stream strategies, hydrating yaml_content one batch at a time."""
+    query = select(Strategy)
+    if active_only:
+        query = query.where(Strategy.is_active == True)
+    return _stream_scalars(db, query)
+
+
 async def create_strategy(
     db: AsyncSession,
     slug: str,
@@ -199,6 +360,7 @@ async def create_strategy(
     db.add(strategy)
     await db.commit()
     await db.refresh(strategy)
+    _STRATEGY_CACHE.pop(slug, None)
     return strategy
 
 
@@ -207,33 +369,27 @@ async def update_strategy(
     slug: str,
     yaml_content: Dict[str, Any]
 ) -> Optional[Strategy]:
-    """Update existing strategy."""
+    """Update existing strategy in a single UPDATE ... RETURNING round-trip."""
     result = await db.execute(
-        select(Strategy).where(Strategy.slug == slug)
+        update(Strategy)
+        .where(Strategy.slug == slug)
+        .values(yaml_content=yaml_content, updated_at=_utc_now())
+        .returning(Strategy)
     )
     strategy = result.scalar_one_or_none()
-
-    if strategy:
-        strategy.yaml_content = yaml_content
-        strategy.updated_at = datetime.utcnow()
-        await db.commit()
-        await db.refresh(strategy)
-
+    await db.commit()
+    _STRATEGY_CACHE.pop(slug, None)
     return strategy
 
 
 async def delete_strategy(db: AsyncSession, slug: str) -> bool:
     """Delete a strategy."""
     result = await db.execute(
-        select(Strategy).where(Strategy.slug == slug)
+        delete(Strategy).where(Strategy.slug == slug)
     )
-    strategy = result.scalar_one_or_none()
-
-    if strategy:
-        await db.delete(strategy)
-        await db.commit()
-        return True
-    return False
+    await db.commit()
+    _STRATEGY_CACHE.pop(slug, None)
+    return result.rowcount > 0
 
 
 # ============================================================================
@@ -244,11 +400,20 @@ async def get_global_setting(
     db: AsyncSession,
     key: str
 ) -> Optional[GlobalSetting]:
-    """Get global setting by key."""
+    """Get global setting by key, served from a short-TTL cache when fresh.
+
+    Cache hits return a detached GlobalSetting that is not bound to ``db``.
+    """
+    setting = _cache_get(_SETTING_CACHE, key, GlobalSetting)
+    if setting is not None:
+        return setting
+
     result = await db.execute(
         select(GlobalSetting).where(GlobalSetting.key == key)
     )
-    return result.scalar_one_or_none()
+    setting = result.scalar_one_or_none()
+    _cache_put(_SETTING_CACHE, key, setting)
+    return setting
 
 
 async def list_global_settings(db: AsyncSession) -> list[GlobalSetting]:
@@ -271,7 +436,7 @@ async def update_global_setting(
     if setting:
         # Update existing
         setting.value = value
-        setting.updated_at = datetime.utcnow()
+        setting.updated_at = _utc_now()
     else:
         # Create new
         setting = GlobalSetting(key=key, value=value)
@@ -279,4 +444,5 @@ async def update_global_setting(
 
     await db.commit()
     await db.refresh(setting)
+    _SETTING_CACHE.pop(key, None)
     return setting
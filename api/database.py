@@ -25,35 +25,21 @@ class DatabaseManager:
         if not self.database_url:
             raise ValueError("DATABASE_URL environment variable is not set")
         
-        if self.database_url.startswith("postgres://"):
-            self.database_url = self.database_url.replace(
-                "postgres://", "postgresql+asyncpg://", 1
-            )
-        elif self.database_url.startswith("postgresql://"):
-            self.database_url = self.database_url.replace(
-                "postgresql://", "postgresql+asyncpg://", 1
-            )
-        
-        parsed = urlparse(self.database_url)
-        query_params = parse_qs(parsed.query)
+        scheme, sep, rest = self.database_url.partition("://")
+        if sep and scheme in ("postgres", "postgresql"):
+            self.database_url = "postgresql+asyncpg://" + rest
         
         connect_args = {}
-        if "sslmode" in query_params:
-            sslmode = query_params["sslmode"][0]
+        parsed = urlparse(self.database_url)
+        if "sslmode=" in parsed.query:
+            query_params = parse_qs(parsed.query)
+            sslmode = query_params.pop("sslmode", [None])[0]
             if sslmode == "require":
                 ssl_context = ssl.create_default_context()
                 connect_args["ssl"] = ssl_context
             
-            del query_params["sslmode"]
             new_query = urlencode(query_params, doseq=True)
-            self.database_url = urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                parsed.params,
-                new_query,
-                parsed.fragment
-            ))
+            self.database_url = urlunparse(parsed._replace(query=new_query))
         
         self.engine = create_async_engine(
             self.database_url,
@@ -61,6 +47,8 @@ class DatabaseManager:
             pool_size=20,
             max_overflow=10,
             pool_pre_ping=True,
+            # Recycle before managed Postgres/proxies drop idle connections
+            pool_recycle=1800,
             connect_args=connect_args,
         )
         
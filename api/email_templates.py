@@ -14,10 +14,11 @@ Design System (FAZ Brand):
 Source: https://brandfetch.com/faz.net, Strichpunkt Design
 """
 
+import functools
 import re
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
-import markdown2
 
 
 # =============================================================================
@@ -41,6 +42,11 @@ COLORS = {
 # Logo - hosted version (globe with quill)
 LOGO_URL = "https://webresearchagent.replit.app/static/logo.png"
 
+# Authentic FAZ Typography: Source Serif 4 (headlines) + Source Sans 3 (body)
+# Fallbacks for email clients that don't support Google Fonts
+FONT_SERIF = "'Source Serif 4', 'Source Serif Pro', Georgia, 'Times New Roman', serif"
+FONT_SANS = "'Source Sans 3', 'Source Sans Pro', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
+
 
 # =============================================================================
 # STRATEGY TEMPLATE CONFIGURATIONS
@@ -91,21 +97,146 @@ STRATEGY_TEMPLATES = {
     },
 }
 
-DEFAULT_TEMPLATE = {
+# Read-only: shared by every render, so neither the mapping nor the per-strategy
+# configs can be mutated by callers
+STRATEGY_TEMPLATES = MappingProxyType({
+    slug: MappingProxyType(config) for slug, config in STRATEGY_TEMPLATES.items()
+})
+
+DEFAULT_TEMPLATE = MappingProxyType({
     "title_template": "Research Update: {topic}",
     "subtitle_template": "AI-powered research insights",
     "subject_prefix": "Research Update:",
     "show_breaking_badge": False
-}
+})
 
 
 # =============================================================================
 # MARKDOWN TO HTML CONVERSION
 # =============================================================================
 
+# Inline styles for email client compatibility, applied to the rendered HTML
+STYLE_MAPPINGS = [
+    # H1 - Main title (rarely used in content)
+    (r'<h1>', f'<h1 style="color: {COLORS["primary"]}; font-family: {FONT_SERIF}; font-size: 28px; font-weight: 700; margin: 0 0 16px 0; letter-spacing: -0.02em; line-height: 1.2;">'),
+
+    # H2 - Section headers (KURZÜBERBLICK, WICHTIGSTE ENTWICKLUNGEN, etc.) - Black rule above
+    (r'<h2>', f'<h2 style="color: {COLORS["primary"]}; font-family: {FONT_SANS}; font-size: 12px; font-weight: 600; margin: 40px 0 20px 0; padding-top: 20px; text-transform: uppercase; letter-spacing: 0.1em; border-top: 2px solid {COLORS["rule"]};">'),
+
+    # H3 - Subheadings within sections (story headlines) - LARGER, prominent serif
+    (r'<h3>', f'<h3 style="color: {COLORS["primary"]}; font-family: {FONT_SERIF}; font-size: 22px; font-weight: 700; margin: 28px 0 12px 0; letter-spacing: -0.015em; line-height: 1.25;">'),
+
+    # H4 - Minor headers
+    (r'<h4>', f'<h4 style="color: {COLORS["primary"]}; font-family: {FONT_SERIF}; font-size: 18px; font-weight: 600; margin: 24px 0 10px 0; line-height: 1.3;">'),
+
+    # Paragraphs - Source Sans, generous line height, tighter bottom margin for flow
+    (r'<p>', f'<p style="color: {COLORS["text"]}; font-family: {FONT_SANS}; font-size: 16px; line-height: 1.75; margin: 0 0 20px 0;">'),
+
+    # Lists - clean styling, list-style-type handles the bullet
+    (r'<ul>', f'<ul style="margin: 0 0 24px 0; padding-left: 20px; list-style-type: disc;">'),
+    (r'<ol>', f'<ol style="margin: 0 0 24px 0; padding-left: 24px;">'),
+    (r'<li>', f'<li style="color: {COLORS["text"]}; font-family: {FONT_SANS}; font-size: 16px; line-height: 1.7; margin-bottom: 10px; padding-left: 6px;">'),
+
+    # Links - subtle, professional
+    (r'<a href="', f'<a style="color: {COLORS["primary"]}; text-decoration: underline; text-decoration-color: {COLORS["accent"]}; text-underline-offset: 2px;" href="'),
+
+    # Strong/Bold - for headlines within content
+    (r'<strong>', f'<strong style="color: {COLORS["primary"]}; font-weight: 600;">'),
+
+    # Emphasis
+    (r'<em>', '<em style="font-style: italic;">'),
+
+    # Tables
+    (r'<table>', f'<table style="border-collapse: collapse; width: 100%; margin: 20px 0; font-size: 14px;">'),
+    (r'<th>', f'<th style="border-bottom: 2px solid {COLORS["rule"]}; padding: 10px 12px; background: transparent; text-align: left; font-weight: 600; color: {COLORS["primary"]}; font-family: {FONT_SANS};">'),
+    (r'<td>', f'<td style="border-bottom: 1px solid {COLORS["border"]}; padding: 10px 12px; color: {COLORS["text"]}; font-family: {FONT_SANS};">'),
+
+    # Code
+    (r'<code>', f'<code style="background: {COLORS["background"]}; padding: 2px 6px; border-radius: 2px; font-family: \'SF Mono\', Monaco, \'Consolas\', monospace; font-size: 13px; color: {COLORS["primary"]};">'),
+    (r'<pre>', f'<pre style="background: {COLORS["background"]}; padding: 16px; border-radius: 2px; overflow-x: auto; margin: 20px 0; border: 1px solid {COLORS["border"]};">'),
+
+    # Superscripts (citations) - gold accent, refined
+    (r'<sup>', f'<sup style="color: {COLORS["accent"]}; font-weight: 600; font-size: 10px; vertical-align: super; margin-left: 1px;">'),
+
+    # Horizontal rules - black, FAZ signature
+    (r'<hr>', f'<hr style="border: none; border-top: 1px solid {COLORS["rule"]}; margin: 28px 0;">'),
+    (r'<hr />', f'<hr style="border: none; border-top: 1px solid {COLORS["rule"]}; margin: 28px 0;" />'),
+]
+
+# Every pattern above is a literal open tag, so all of them are applied in one
+# scan: an alternation of the escaped tags, dispatched through a dict. The
+# group makes split() keep the matched tags at the odd indices.
+_STYLE_LOOKUP = dict(STYLE_MAPPINGS)
+_STYLE_TAG_RE = re.compile('(' + '|'.join(re.escape(tag) for tag in _STYLE_LOOKUP) + ')')
+
+
+def _inject_styles(html: str) -> str:
+    """Replace every known open tag with its styled version in one scan."""
+    parts = _STYLE_TAG_RE.split(html)
+    parts[1::2] = [_STYLE_LOOKUP[tag] for tag in parts[1::2]]
+    return ''.join(parts)
+
+
+# Stray lines holding only 1-6 hashes (and whitespace), including their newline
+_HASH_LINE_RE = re.compile(r'^[^\S\n]*#{1,6}[^\S\n]*(?:\n|$)', re.MULTILINE)
+
+# Characters escaped in untrusted text (topics, source titles, URLs) before it
+# is placed into HTML text or attribute values
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+# Citation numbers like [1], and markdown links [text](url)
+_CITATION_NUM_RE = re.compile(r'\[(\d+)\]')
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+
+def escape_html(value) -> str:
+    """Escape a value for safe use in HTML text and quoted attributes."""
+    return str(value).translate(_HTML_ESCAPE)
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_backend():
+    """Import the markdown renderer on first use.
+
+    cmarkgfm (libcmark-gfm, C) covers tables, strikethrough and task lists
+    natively; UNSAFE keeps the raw <sup> citation markup. Without it,
+    markdown2 is used with the equivalent extras. Importing here keeps
+    callers that never render markdown (e.g. subject lines) from paying
+    for either package.
+    """
+    try:
+        import cmarkgfm
+        from cmarkgfm.cmark import Options as CmarkOptions
+    except ImportError:  # cmarkgfm is optional; markdown2 is used instead
+        import markdown2
+        return functools.partial(
+            markdown2.markdown,
+            extras=['fenced-code-blocks', 'tables', 'strike', 'task_list']
+        )
+    return functools.partial(
+        cmarkgfm.github_flavored_markdown_to_html,
+        options=CmarkOptions.CMARK_OPT_UNSAFE
+    )
+
+
+def _render_markdown(text: str) -> str:
+    """Render markdown to bare HTML with the fastest available backend."""
+    return _markdown_backend()(text)
+
+
+@functools.lru_cache(maxsize=512)
 def markdown_to_html(markdown_text: str, is_daily_briefing: bool = False) -> str:
     """Convert markdown to HTML with professional inline styling.
 
+    Memoized on the section text, so sections repeated across previews,
+    retries and recipients are rendered once.
+
     Args:
         markdown_text: Markdown text to convert
         is_daily_briefing: If True, apply special styling for daily briefing sections
@@ -117,88 +248,85 @@ def markdown_to_html(markdown_text: str, is_daily_briefing: bool = False) -> str
         return ''
 
     # Remove stray hash-only lines
-    cleaned_lines = []
-    for line in markdown_text.splitlines():
-        if line.strip() in {"#", "##", "###", "####", "#####", "######"}:
-            continue
-        cleaned_lines.append(line)
-    markdown_text = "\n".join(cleaned_lines)
+    markdown_text = _HASH_LINE_RE.sub('', markdown_text)
 
-    # Pre-process: Convert citation numbers [1], [2] to superscript format
-    processed_text = re.sub(r'\[(\d+)\]', r'<sup>[\1]</sup>', markdown_text)
+    # Pre-process: Convert citation numbers [1], [2] to superscript format.
+    # A substring test skips the regex for sections without any brackets.
+    if '[' in markdown_text:
+        markdown_text = _CITATION_NUM_RE.sub(r'<sup>[\1]</sup>', markdown_text)
 
     # Convert markdown to HTML
-    html = markdown2.markdown(
-        processed_text,
-        extras=['fenced-code-blocks', 'tables', 'strike', 'task_list']
-    )
+    html = _render_markdown(markdown_text)
 
     # Apply inline styles for email client compatibility
-    # Authentic FAZ Typography: Source Serif 4 (headlines) + Source Sans 3 (body)
-    # Fallbacks for email clients that don't support Google Fonts
+    html = _inject_styles(html)
 
-    FONT_SERIF = "'Source Serif 4', 'Source Serif Pro', Georgia, 'Times New Roman', serif"
-    FONT_SANS = "'Source Sans 3', 'Source Sans Pro', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
-
-    style_mappings = [
-        # H1 - Main title (rarely used in content)
-        (r'<h1>', f'<h1 style="color: {COLORS["primary"]}; font-family: {FONT_SERIF}; font-size: 28px; font-weight: 700; margin: 0 0 16px 0; letter-spacing: -0.02em; line-height: 1.2;">'),
-
-        # H2 - Section headers (KURZÜBERBLICK, WICHTIGSTE ENTWICKLUNGEN, etc.) - Black rule above
-        (r'<h2>', f'<h2 style="color: {COLORS["primary"]}; font-family: {FONT_SANS}; font-size: 12px; font-weight: 600; margin: 40px 0 20px 0; padding-top: 20px; text-transform: uppercase; letter-spacing: 0.1em; border-top: 2px solid {COLORS["rule"]};">'),
-
-        # H3 - Subheadings within sections (story headlines) - LARGER, prominent serif
-        (r'<h3>', f'<h3 style="color: {COLORS["primary"]}; font-family: {FONT_SERIF}; font-size: 22px; font-weight: 700; margin: 28px 0 12px 0; letter-spacing: -0.015em; line-height: 1.25;">'),
-
-        # H4 - Minor headers
-        (r'<h4>', f'<h4 style="color: {COLORS["primary"]}; font-family: {FONT_SERIF}; font-size: 18px; font-weight: 600; margin: 24px 0 10px 0; line-height: 1.3;">'),
-
-        # Paragraphs - Source Sans, generous line height, tighter bottom margin for flow
-        (r'<p>', f'<p style="color: {COLORS["text"]}; font-family: {FONT_SANS}; font-size: 16px; line-height: 1.75; margin: 0 0 20px 0;">'),
+    # No additional bullet character needed - using native list-style-type: disc
 
-        # Lists - clean styling, list-style-type handles the bullet
-        (r'<ul>', f'<ul style="margin: 0 0 24px 0; padding-left: 20px; list-style-type: disc;">'),
-        (r'<ol>', f'<ol style="margin: 0 0 24px 0; padding-left: 24px;">'),
-        (r'<li>', f'<li style="color: {COLORS["text"]}; font-family: {FONT_SANS}; font-size: 16px; line-height: 1.7; margin-bottom: 10px; padding-left: 6px;">'),
+    return html
 
-        # Links - subtle, professional
-        (r'<a href="', f'<a style="color: {COLORS["primary"]}; text-decoration: underline; text-decoration-color: {COLORS["accent"]}; text-underline-offset: 2px;" href="'),
 
-        # Strong/Bold - for headlines within content
-        (r'<strong>', f'<strong style="color: {COLORS["primary"]}; font-weight: 600;">'),
+# Paragraph placed between sections so they can be rendered in one markdown
+# pass and split apart afterwards; the split drops it with its blank lines
+_SECTION_SENTINEL = 'SECSPLIT7f3a9c'
+_SECTION_JOIN = f'\n\n{_SECTION_SENTINEL}\n\n'
+_SECTION_SPLIT_RE = re.compile(rf'(?<=\n)\n?<p[^>]*>{_SECTION_SENTINEL}</p>\n+')
 
-        # Emphasis
-        (r'<em>', '<em style="font-style: italic;">'),
 
-        # Tables
-        (r'<table>', f'<table style="border-collapse: collapse; width: 100%; margin: 20px 0; font-size: 14px;">'),
-        (r'<th>', f'<th style="border-bottom: 2px solid {COLORS["rule"]}; padding: 10px 12px; background: transparent; text-align: left; font-weight: 600; color: {COLORS["primary"]}; font-family: {FONT_SANS};">'),
-        (r'<td>', f'<td style="border-bottom: 1px solid {COLORS["border"]}; padding: 10px 12px; color: {COLORS["text"]}; font-family: {FONT_SANS};">'),
+def render_sections_html(sections: list, is_daily_briefing: bool = False) -> list:
+    """Convert the non-empty markdown sections to HTML in a single pass.
 
-        # Code
-        (r'<code>', f'<code style="background: {COLORS["background"]}; padding: 2px 6px; border-radius: 2px; font-family: \'SF Mono\', Monaco, \'Consolas\', monospace; font-size: 13px; color: {COLORS["primary"]};">'),
-        (r'<pre>', f'<pre style="background: {COLORS["background"]}; padding: 16px; border-radius: 2px; overflow-x: auto; margin: 20px 0; border: 1px solid {COLORS["border"]};">'),
+    Falls back to one markdown_to_html call per section if a section leaves
+    a block open (e.g. an unclosed code fence) and swallows a separator.
 
-        # Superscripts (citations) - gold accent, refined
-        (r'<sup>', f'<sup style="color: {COLORS["accent"]}; font-weight: 600; font-size: 10px; vertical-align: super; margin-left: 1px;">'),
+    Args:
+        sections: List of markdown section strings
+        is_daily_briefing: Passed through to markdown_to_html
 
-        # Horizontal rules - black, FAZ signature
-        (r'<hr>', f'<hr style="border: none; border-top: 1px solid {COLORS["rule"]}; margin: 28px 0;">'),
-        (r'<hr />', f'<hr style="border: none; border-top: 1px solid {COLORS["rule"]}; margin: 28px 0;" />'),
+    Returns:
+        One HTML string per non-empty section
+    """
+    sections = [section for section in sections if section]
+    if len(sections) < 2:
+        return [markdown_to_html(section, is_daily_briefing) for section in sections]
+
+    html = markdown_to_html(_SECTION_JOIN.join(sections), is_daily_briefing)
+    parts = _SECTION_SPLIT_RE.split(html)
+    if len(parts) != len(sections):
+        return [markdown_to_html(section, is_daily_briefing) for section in sections]
+
+    # Sections holding only stray hashes render to nothing when joined, but
+    # to an empty paragraph on their own
+    return [
+        part or markdown_to_html(section, is_daily_briefing)
+        for part, section in zip(parts, sections)
     ]
 
-    for pattern, replacement in style_mappings:
-        html = re.sub(pattern, replacement, html)
 
-    # No additional bullet character needed - using native list-style-type: disc
-
-    return html
+def _render_cache_clear() -> None:
+    """Drop memoized render output, e.g. between tests."""
+    markdown_to_html.cache_clear()
+    _render_citation_rows.cache_clear()
+    _format_executed_at.cache_clear()
 
 
 # =============================================================================
 # CITATION HANDLING
 # =============================================================================
 
+def _evidence_fields(ev) -> tuple:
+    """Normalize an evidence dict or object to (url, title, snippet, date)."""
+    if isinstance(ev, dict):
+        return (
+            ev.get('url', ''), ev.get('title', ''),
+            ev.get('snippet', ''), ev.get('date', '')
+        )
+    return (
+        getattr(ev, 'url', ''), getattr(ev, 'title', ''),
+        getattr(ev, 'snippet', ''), getattr(ev, 'date', '')
+    )
+
+
 def extract_and_number_citations(sections: list, evidence: list) -> tuple:
     """Extract citations from markdown, merge with evidence, assign numbers.
 
@@ -210,75 +338,70 @@ def extract_and_number_citations(sections: list, evidence: list) -> tuple:
         tuple: (modified_sections, citations_registry)
     """
     citations_registry = []
-    url_to_number = {}
-
-    for section in sections:
-        if not section:
-            continue
-
-        for match in re.finditer(r'\[([^\]]+)\]\(([^\)]+)\)', section):
-            link_text = match.group(1)
-            url = match.group(2).strip()
-
-            if url not in url_to_number:
-                number = len(citations_registry) + 1
-                url_to_number[url] = number
-                citations_registry.append({
-                    "number": number,
-                    "url": url,
-                    "text": link_text,
-                    "snippet": None,
-                    "date": None
-                })
-
-    for ev in evidence:
-        if isinstance(ev, dict):
-            url = ev.get('url', '').strip()
-            title = ev.get('title', '')
-            snippet = ev.get('snippet', '')
-            date = ev.get('date', '')
-        else:
-            url = getattr(ev, 'url', '').strip()
-            title = getattr(ev, 'title', '')
-            snippet = getattr(ev, 'snippet', '')
-            date = getattr(ev, 'date', '')
+    url_to_citation = {}
+
+    # Links are numbered first, in order of appearance, so one sub() pass
+    # both registers each URL and rewrites the link to its superscript
+    def replace_link(match):
+        url = match.group(2).strip()
+        citation = url_to_citation.get(url)
+        if citation is None:
+            citation = {
+                "number": len(citations_registry) + 1,
+                "url": url,
+                "text": match.group(1),
+                "snippet": None,
+                "date": None
+            }
+            url_to_citation[url] = citation
+            citations_registry.append(citation)
+        return f'{match.group(1)}<sup>[{citation["number"]}]</sup>'
+
+    modified_sections = [
+        _MD_LINK_RE.sub(replace_link, section) if section else section
+        for section in sections
+    ]
 
+    for url, title, snippet, date in map(_evidence_fields, evidence):
+        url = url.strip()
         if not url:
             continue
 
-        if url in url_to_number:
-            idx = url_to_number[url] - 1
-            if not citations_registry[idx]['snippet'] and snippet:
-                citations_registry[idx]['snippet'] = snippet
-            if not citations_registry[idx]['date'] and date:
-                citations_registry[idx]['date'] = date
+        citation = url_to_citation.get(url)
+        if citation is not None:
+            if not citation['snippet'] and snippet:
+                citation['snippet'] = snippet
+            if not citation['date'] and date:
+                citation['date'] = date
         else:
-            number = len(citations_registry) + 1
-            url_to_number[url] = number
-            citations_registry.append({
-                "number": number,
+            citation = {
+                "number": len(citations_registry) + 1,
                 "url": url,
                 "text": title,
                 "snippet": snippet,
                 "date": date
-            })
+            }
+            url_to_citation[url] = citation
+            citations_registry.append(citation)
 
-    modified_sections = []
-    for section in sections:
-        if not section:
-            modified_sections.append(section)
-            continue
+    return modified_sections, citations_registry
 
-        def replace_link(match):
-            link_text = match.group(1)
-            url = match.group(2).strip()
-            number = url_to_number.get(url, '?')
-            return f'{link_text}<sup>[{number}]</sup>'
 
-        modified = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', replace_link, section)
-        modified_sections.append(modified)
+# Static wrapper around the rendered citation rows
+_CITATIONS_PREFIX = f'''
+        <div style="margin-top: 40px;">
+            <!-- Double rule top -->
+            <div style="border-top: 2px solid {COLORS["rule"]}; margin-bottom: 4px;"></div>
+            <div style="border-top: 1px solid {COLORS["rule"]}; margin-bottom: 20px;"></div>
+
+            <h2 style="color: {COLORS["primary"]}; font-family: {FONT_SANS}; font-size: 11px; font-weight: 600; margin: 0 0 20px 0; text-transform: uppercase; letter-spacing: 0.12em;">Quellen</h2>
 
-    return modified_sections, citations_registry
+            <table style="width: 100%; border-collapse: collapse;">
+                '''
+_CITATIONS_SUFFIX = '''
+            </table>
+        </div>
+    '''
 
 
 def render_citations_html(citations: list) -> str:
@@ -293,22 +416,31 @@ def render_citations_html(citations: list) -> str:
     if not citations:
         return ''
 
-    FONT_SERIF = "'Source Serif 4', 'Source Serif Pro', Georgia, 'Times New Roman', serif"
-    FONT_SANS = "'Source Sans 3', 'Source Sans Pro', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
+    return _render_citation_rows(tuple(
+        (
+            citation.get('number', '?'),
+            citation.get('url', '#'),
+            citation.get('date', ''),
+            citation.get('text', citation.get('title', 'Source')),
+        )
+        for citation in citations
+    ))
 
-    citation_rows = []
-    for citation in citations:
-        number = citation.get('number', '?')
-        url = citation.get('url', '#')
-        date = citation.get('date', '')
-        title = citation.get('text', citation.get('title', 'Source'))
 
+@functools.lru_cache(maxsize=128)
+def _render_citation_rows(rows: tuple) -> str:
+    """Render the sources section for (number, url, date, title) rows."""
+    citation_rows = []
+    for number, url, date, title in rows:
         # Extract domain for display (clean format)
         domain = ''
         if url.startswith('http') and len(url.split('/')) > 2:
             domain = url.split('/')[2].replace('www.', '')
 
-        date_str = f'&nbsp;&nbsp;·&nbsp;&nbsp;{date}' if date else ''
+        date_str = f'&nbsp;&nbsp;·&nbsp;&nbsp;{escape_html(date)}' if date else ''
+        domain = escape_html(domain)
+        url = escape_html(url)
+        title = escape_html(title)
 
         citation_rows.append(f'''
             <tr>
@@ -320,25 +452,27 @@ def render_citations_html(citations: list) -> str:
             </tr>
         ''')
 
-    return f'''
-        <div style="margin-top: 40px;">
-            <!-- Double rule top -->
-            <div style="border-top: 2px solid {COLORS["rule"]}; margin-bottom: 4px;"></div>
-            <div style="border-top: 1px solid {COLORS["rule"]}; margin-bottom: 20px;"></div>
-
-            <h2 style="color: {COLORS["primary"]}; font-family: {FONT_SANS}; font-size: 11px; font-weight: 600; margin: 0 0 20px 0; text-transform: uppercase; letter-spacing: 0.12em;">Quellen</h2>
-
-            <table style="width: 100%; border-collapse: collapse;">
-                {''.join(citation_rows)}
-            </table>
-        </div>
-    '''
+    return ''.join((_CITATIONS_PREFIX, *citation_rows, _CITATIONS_SUFFIX))
 
 
 # =============================================================================
 # HEADER COMPONENTS
 # =============================================================================
 
+@functools.lru_cache(maxsize=128)
+def _format_executed_at(executed_at) -> tuple:
+    """Split an ISO timestamp into header (date, time) strings.
+
+    fromisoformat accepts a trailing 'Z' on Python 3.11+. Memoized because
+    every recipient of a digest shares the same executed_at.
+    """
+    try:
+        dt = datetime.fromisoformat(executed_at)
+    except (ValueError, TypeError):
+        return escape_html(executed_at), ""
+    return dt.strftime('%d. %B %Y'), dt.strftime('%H:%M')
+
+
 def render_header(
     research_topic: str,
     strategy_slug: str,
@@ -354,17 +488,8 @@ def render_header(
     Returns:
         HTML string for header
     """
-    FONT_SERIF = "'Source Serif 4', 'Source Serif Pro', Georgia, 'Times New Roman', serif"
-    FONT_SANS = "'Source Sans 3', 'Source Sans Pro', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
-
-    # Format date
-    try:
-        dt = datetime.fromisoformat(executed_at.replace('Z', '+00:00'))
-        formatted_date = dt.strftime('%d. %B %Y')
-        formatted_time = dt.strftime('%H:%M')
-    except (ValueError, AttributeError):
-        formatted_date = executed_at
-        formatted_time = ""
+    formatted_date, formatted_time = _format_executed_at(executed_at)
+    research_topic = escape_html(research_topic)
 
     return f'''
         <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0" style="margin-bottom: 32px;">
@@ -392,14 +517,15 @@ def render_header(
     '''
 
 
+@functools.lru_cache(maxsize=None)
 def render_ai_notice() -> str:
     """Render the AI-generated content notice - subtle, inline, professional.
 
+    The notice is constant, so it is rendered once and reused.
+
     Returns:
         HTML string for notice
     """
-    FONT_SANS = "'Source Sans 3', 'Source Sans Pro', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
-
     return f'''
         <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0" style="margin-bottom: 28px;">
             <tr>
@@ -418,15 +544,15 @@ def render_ai_notice() -> str:
 # FOOTER
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
 def render_footer() -> str:
     """Render the email footer - minimal, centered, elegant.
 
+    The footer is constant, so it is rendered once and reused.
+
     Returns:
         HTML string for footer
     """
-    FONT_SERIF = "'Source Serif 4', 'Source Serif Pro', Georgia, 'Times New Roman', serif"
-    FONT_SANS = "'Source Sans 3', 'Source Sans Pro', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
-
     return f'''
         <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0" style="margin-top: 48px;">
             <tr>
@@ -450,23 +576,15 @@ def render_footer() -> str:
 # COMPLETE EMAIL WRAPPER
 # =============================================================================
 
-def create_email_html(research_topic: str, date_str: str, content_html: str) -> str:
-    """Wrap content in complete email template - FAZ editorial style.
-
-    Args:
-        research_topic: The research topic
-        date_str: Date string
-        content_html: Main content HTML
-
-    Returns:
-        Complete HTML email
-    """
-    return f'''<!DOCTYPE html>
+# Email shell rendered once at import and split around its two slots
+# (title topic and body content), so each email is a single join
+_SLOT = '\x00'
+_EMAIL_SHELL = f'''<!DOCTYPE html>
 <html lang="de">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{research_topic} - Daily Briefing</title>
+    <title>{_SLOT} - Daily Briefing</title>
     <!-- Google Fonts: Source Serif 4 + Source Sans 3 (FAZ brand fonts) -->
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
@@ -494,7 +612,7 @@ def create_email_html(research_topic: str, date_str: str, content_html: str) ->
                 <table role="presentation" class="email-container" cellspacing="0" cellpadding="0" border="0" style="max-width: 640px; width: 100%; margin: 0 auto; background-color: {COLORS["white"]};">
                     <tr>
                         <td class="content" style="padding: 40px 48px;">
-                            {content_html}
+                            {_SLOT}
                         </td>
                     </tr>
                 </table>
@@ -504,6 +622,33 @@ def create_email_html(research_topic: str, date_str: str, content_html: str) ->
 </body>
 </html>
 '''
+_EMAIL_PREFIX, _EMAIL_MIDDLE, _EMAIL_SUFFIX = _EMAIL_SHELL.split(_SLOT)
+
+
+def create_email_html(research_topic: str, date_str: str, content_html) -> str:
+    """Wrap content in complete email template - FAZ editorial style.
+
+    Args:
+        research_topic: The research topic
+        date_str: Date string
+        content_html: Main content HTML, or a list of HTML parts placed on
+            separate lines
+
+    Returns:
+        Complete HTML email
+    """
+    if isinstance(content_html, str):
+        content_html = (content_html,)
+
+    # Shell fragments and newline-separated parts are copied once, in a single join
+    pieces = [_EMAIL_PREFIX, escape_html(research_topic), _EMAIL_MIDDLE]
+    for index, part in enumerate(content_html):
+        if index:
+            pieces.append('\n')
+        pieces.append(part)
+    pieces.append(_EMAIL_SUFFIX)
+
+    return ''.join(pieces)
 
 
 # =============================================================================
@@ -530,45 +675,69 @@ def render_complete_email(
         strategy_slug: Strategy identifier
         evidence_count: Number of sources analyzed
         executed_at: ISO timestamp
-        current_date: Optional date string
+        current_date: Optional date string (unused; the header date comes
+            from executed_at)
 
     Returns:
         Complete HTML email string
     """
-    if not current_date:
-        current_date = datetime.utcnow().strftime('%d. %B %Y')
+    body_html = render_body_html(sections, citations, strategy_slug)
+    return render_recipient_email(body_html, research_topic, strategy_slug, executed_at)
 
-    is_daily_briefing = strategy_slug == 'daily_news_briefing'
 
-    # Build content
-    content_parts = []
+def render_body_html(sections: list, citations: list, strategy_slug: str) -> str:
+    """Render the recipient-independent part of an email: sections and sources.
+
+    This holds all of the markdown and citation work, so batch sends can
+    render it once and wrap it per recipient with render_recipient_email.
 
-    # 1. Header with logo, topic, metadata
-    header_html = render_header(research_topic, strategy_slug, executed_at)
-    content_parts.append(header_html)
+    Args:
+        sections: List of markdown section strings
+        citations: List of citation dicts
+        strategy_slug: Strategy identifier
 
-    # 2. AI notice
-    ai_notice = render_ai_notice()
-    content_parts.append(ai_notice)
+    Returns:
+        Newline-separated section and sources HTML
+    """
+    is_daily_briefing = strategy_slug == 'daily_news_briefing'
 
-    # 3. Main content sections
-    for section in sections:
-        if section:
-            section_html = markdown_to_html(section, is_daily_briefing)
-            content_parts.append(section_html)
+    # 1. Main content sections
+    body_parts = render_sections_html(sections, is_daily_briefing)
 
-    # 4. Citations/Sources
+    # 2. Citations/Sources
     citations_html = render_citations_html(citations)
     if citations_html:
-        content_parts.append(citations_html)
+        body_parts.append(citations_html)
+
+    return '\n'.join(body_parts)
+
+
+def render_recipient_email(
+    body_html: str,
+    research_topic: str,
+    strategy_slug: str,
+    executed_at: str
+) -> str:
+    """Wrap a pre-rendered body in the header, AI notice, footer and shell.
 
-    # 5. Footer
-    footer_html = render_footer()
-    content_parts.append(footer_html)
+    Args:
+        body_html: Output of render_body_html
+        research_topic: The research topic/query
+        strategy_slug: Strategy identifier
+        executed_at: ISO timestamp
 
-    content_html = '\n'.join(content_parts)
+    Returns:
+        Complete HTML email string
+    """
+    content_parts = [
+        render_header(research_topic, strategy_slug, executed_at),
+        render_ai_notice(),
+    ]
+    if body_html:
+        content_parts.append(body_html)
+    content_parts.append(render_footer())
 
-    return create_email_html(research_topic, current_date, content_html)
+    return create_email_html(research_topic, executed_at, content_parts)
 
 
 def generate_strategy_subject_line(
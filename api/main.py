@@ -291,8 +291,7 @@ async def get_tasks(
     Returns:
         List of tasks for the email
     """
-    tasks = await crud.get_tasks_by_email(db, email)
-    return [task.to_dict() for task in tasks]
+    return [task.to_dict() async for task in crud.stream_tasks_by_email(db, email)]
 
 
 @app.patch(
@@ -1027,8 +1026,10 @@ async def list_strategies(
     _: None = Depends(verify_api_key)
 ):
     """List all strategies."""
-    strategies = await crud.list_strategies(db, active_only=active_only)
-    return [s.to_dict() for s in strategies]
+    return [
+        s.to_dict()
+        async for s in crud.stream_strategies(db, active_only=active_only)
+    ]
 
 
 @app.get(
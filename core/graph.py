@@ -440,6 +440,16 @@ async def scope(state: State) -> State:
         except Exception:
             pass
 
+    # Tag the trace with the strategy so it can be filtered server-side
+    if lf_client and state.strategy_slug:
+        try:
+            lf_client.update_current_trace(
+                tags=[f"strategy:{state.strategy_slug}"],
+                metadata={"strategy_slug": state.strategy_slug},
+            )
+        except Exception:
+            pass
+
     if collector:
         collector.end_phase("scope")
         if state.strategy_slug:
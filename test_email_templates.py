@@ -8,6 +8,11 @@ from api.email_templates import (
     render_complete_email,
     generate_strategy_subject_line,
     extract_and_number_citations,
+    markdown_to_html,
+    render_sections_html,
+    render_body_html,
+    render_recipient_email,
+    _render_cache_clear,
     STRATEGY_TEMPLATES
 )
 from datetime import datetime, timezone
@@ -204,6 +209,76 @@ def test_email_wrapper_boundaries():
     print()
 
 
+def test_untrusted_text_escaped():
+    """Topic and source fields are HTML-escaped; markdown content is not."""
+    print("Testing HTML escaping of untrusted text...")
+
+    html = render_complete_email(
+        research_topic='AT&T <script>alert(1)</script>',
+        sections=["Body with **bold**"],
+        citations=[{"number": 1, "url": 'https://example.com/?a=1&b="2"', "text": "<b>Title</b>", "date": ""}],
+        strategy_slug="daily_news_briefing",
+        evidence_count=1,
+        executed_at=datetime.now(timezone.utc).isoformat(),
+        current_date="November 17, 2025"
+    )
+
+    assert "<script>" not in html, "Research topic not escaped"
+    assert "AT&amp;T &lt;script&gt;" in html, "Research topic escaped incorrectly"
+    assert 'href="https://example.com/?a=1&amp;b=&quot;2&quot;"' in html, "Citation URL not escaped"
+    assert "&lt;b&gt;Title&lt;/b&gt;" in html, "Citation title not escaped"
+    assert "<strong" in html, "Markdown content should still render as HTML"
+
+    print("  ✅ Topic, source titles and URLs escaped")
+    print()
+
+
+def test_sections_rendered_in_one_pass():
+    """Joined section rendering matches rendering each section alone."""
+    print("Testing single-pass section rendering...")
+    _render_cache_clear()
+
+    sections = [
+        "## Lead\n\n- one [1]\n- two",
+        "",
+        "###",
+        "| a | b |\n|---|---|\n| 1 | 2 |",
+        "```\nunclosed fence",
+        "Trailing paragraph",
+    ]
+    expected = [markdown_to_html(section) for section in sections if section]
+
+    assert render_sections_html(sections) == expected, "Joined rendering differs"
+
+    print("  ✅ Sections split back out unchanged")
+    print()
+
+
+def test_body_shared_across_recipients():
+    """A body rendered once wraps into the same email as a full render."""
+    print("Testing shared body rendering...")
+
+    sections = ["## Lead\n\nBody text [1]"]
+    citations = [{"number": 1, "url": "https://example.com", "text": "Example", "date": ""}]
+    executed_at = datetime.now(timezone.utc).isoformat()
+
+    body_html = render_body_html(sections, citations, "daily_news_briefing")
+    for topic in ("AI news", "Climate policy"):
+        expected = render_complete_email(
+            research_topic=topic,
+            sections=sections,
+            citations=citations,
+            strategy_slug="daily_news_briefing",
+            evidence_count=1,
+            executed_at=executed_at,
+        )
+        wrapped = render_recipient_email(body_html, topic, "daily_news_briefing", executed_at)
+        assert wrapped == expected, f"Wrapped email differs for {topic!r}"
+
+    print("  ✅ Per-recipient wrapping matches full render")
+    print()
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Email Template Engine Test Suite")
@@ -215,6 +290,9 @@ if __name__ == "__main__":
     test_subject_line_generation()
     test_markdown_conversion()
     test_email_wrapper_boundaries()
+    test_sections_rendered_in_one_pass()
+    test_body_shared_across_recipients()
+    test_untrusted_text_escaped()
     test_complete_email_rendering()
 
     print("=" * 60)
@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+
+from api import crud
+
+
+def _classification(strategy_slug="news/daily"):
+    return {
+        "category": "news",
+        "time_window": "day",
+        "depth": "brief",
+        "strategy_slug": strategy_slug,
+        "tasks": ["task"],
+        "variables": {},
+    }
+
+
+def _session(rowcount):
+    """Mock session whose execute() reports rowcount inserted rows."""
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(rowcount=rowcount)
+    return db
+
+
+def _compiled_insert(db):
+    statement = db.execute.await_args.args[0]
+    return statement.compile(dialect=postgresql.dialect())
+
+
+@pytest.mark.anyio(backends=["asyncio"])
+async def test_bulk_save_empty_input_skips_database():
+    db = _session(rowcount=0)
+
+    assert await crud.save_scope_classifications_bulk(db, []) == 0
+    db.execute.assert_not_awaited()
+    db.commit.assert_not_awaited()
+
+
+@pytest.mark.anyio(backends=["asyncio"])
+async def test_bulk_save_sends_one_row_per_request_hash():
+    db = _session(rowcount=2)
+
+    inserted = await crud.save_scope_classifications_bulk(db, [
+        ("AI News", _classification("first")),
+        ("ai news", _classification("second")),
+        ("Climate policy", _classification()),
+    ])
+
+    assert inserted == 2
+    compiled = _compiled_insert(db)
+    hashes = [v for k, v in compiled.params.items() if k.startswith("request_hash")]
+    assert sorted(hashes) == sorted([crud._request_hash("AI News"), crud._request_hash("Climate policy")])
+    slugs = [v for k, v in compiled.params.items() if k.startswith("strategy_slug")]
+    assert "first" in slugs and "second" not in slugs
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.anyio(backends=["asyncio"])
+async def test_bulk_save_skips_existing_hashes():
+    # Postgres reports 0 rows when every request_hash already exists
+    db = _session(rowcount=0)
+
+    inserted = await crud.save_scope_classifications_bulk(db, [("AI News", _classification())])
+
+    assert inserted == 0
+    assert "ON CONFLICT (request_hash) DO NOTHING" in str(_compiled_insert(db))
+    db.commit.assert_awaited_once()
+
+
+def _strategy_session(strategy):
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(**{"scalar_one_or_none.return_value": strategy})
+    return db
+
+
+@pytest.mark.anyio(backends=["asyncio"])
+async def test_strategy_cache_returns_detached_copies():
+    crud._STRATEGY_CACHE.clear()
+    row = crud.Strategy(slug="news/daily", yaml_content={"meta": {"slug": "news/daily"}}, is_active=True)
+
+    try:
+        assert await crud.get_strategy(_strategy_session(row), "news/daily") is row
+
+        other_db = _strategy_session(None)
+        first = await crud.get_strategy(other_db, "news/daily")
+        second = await crud.get_strategy(other_db, "news/daily")
+
+        other_db.execute.assert_not_awaited()
+        assert first is not row and first is not second
+        assert first.to_dict() == row.to_dict()
+
+        # Mutating a returned copy leaves the cached snapshot untouched
+        first.yaml_content["meta"]["slug"] = "changed"
+        assert second.yaml_content["meta"]["slug"] == "news/daily"
+    finally:
+        crud._STRATEGY_CACHE.clear()
+
+
+def test_lookup_cache_is_bounded():
+    cache = {}
+    for index in range(crud.LOOKUP_CACHE_SIZE + 10):
+        crud._cache_put(cache, f"key{index}", crud.GlobalSetting(key=f"key{index}", value={}))
+
+    assert len(cache) == crud.LOOKUP_CACHE_SIZE
+    assert "key0" not in cache
+    assert f"key{crud.LOOKUP_CACHE_SIZE + 9}" in cache